@@ -1,48 +1,92 @@
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN, SERVICE_TRACK_PACKAGE, SERVICE_REMOVE_PACKAGE
+from .const import DOMAIN, DATA_ENGINE
 from .coordinator import ParcelsAppCoordinator
+from .engine import ParcelsAppEngine
+from .services import async_setup_services, async_unload_services
+from .webhook import async_setup_webhook
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR, Platform.BUTTON]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator = ParcelsAppCoordinator(hass, entry)
-    await coordinator.async_init()
-    await coordinator.async_config_entry_first_refresh()
+    await async_migrate_unique_ids(hass, entry)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Every entry shares one engine, created by the first one set up
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    engine = domain_data.get(DATA_ENGINE)
+    if engine is None:
+        engine = domain_data[DATA_ENGINE] = ParcelsAppEngine(hass)
+    coordinator = ParcelsAppCoordinator(hass, entry, engine)
+    engine.register(entry.entry_id, coordinator)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async def async_close_coordinator(event: Event) -> None:
+        # Flush pending changes and close the HTTP session on shutdown
+        await async_release_coordinator(hass, coordinator)
 
-    async def handle_track_package(call: ServiceCall) -> None:
-        tracking_id = call.data["tracking_id"]
-        name = call.data.get("name")
-        await coordinator.track_package(tracking_id, name)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close_coordinator)
+    )
 
-        # Notify sensor platform to add the new entity
-        async_dispatcher_send(hass, f"{DOMAIN}_new_package", tracking_id)
+    try:
+        await coordinator.async_init()
+    except Exception:
+        # Setup will be retried with a new coordinator, don't leak this one's sockets
+        await async_release_coordinator(hass, coordinator)
+        raise
 
-    hass.services.async_register(DOMAIN, SERVICE_TRACK_PACKAGE, handle_track_package)
+    domain_data[entry.entry_id] = coordinator
 
-    async def handle_remove_package(call: ServiceCall) -> None:
-        tracking_id = call.data["tracking_id"]
-        await coordinator.remove_package(tracking_id)
+    # Entities are created from the stored packages, without waiting for the API
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+    )
 
-        # Notify sensor platform to remove the entity
-        async_dispatcher_send(hass, f"{DOMAIN}_remove_package", tracking_id)
+    async_setup_services(hass)
+    async_setup_webhook(hass, entry, coordinator)
 
-    hass.services.async_register(DOMAIN, SERVICE_REMOVE_PACKAGE, handle_remove_package)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
+async def async_migrate_unique_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # Unique IDs used to be the same for every entry, scope them to the entry
+    # while keeping the entity IDs of existing entities
+    @callback
+    def migrate_unique_id(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
+        unique_id = entity_entry.unique_id
+        if unique_id.startswith("tracking_"):
+            return {"new_unique_id": f"{entry.entry_id}_{unique_id}"}
+        if unique_id.startswith(f"{DOMAIN}_"):
+            return {"new_unique_id": f"{entry.entry_id}_{unique_id[len(DOMAIN) + 1:]}"}
+        return None
+
+    await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+
+async def async_release_coordinator(
+    hass: HomeAssistant, coordinator: ParcelsAppCoordinator
+) -> None:
+    # Shut the coordinator down, and the engine and services with the last one
+    await coordinator.async_shutdown()
+    engine = hass.data[DOMAIN].get(DATA_ENGINE)
+    if engine is not None and not engine.coordinators:
+        del hass.data[DOMAIN][DATA_ENGINE]
+        async_unload_services(hass)
+        await engine.async_close()
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # Options changed, rebuild the coordinator with the new settings
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Disconnect dispatcher listeners
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await async_release_coordinator(hass, coordinator)
         unsub_dispatchers = hass.data[DOMAIN].pop(entry.entry_id + "_unsub_dispatcher", [])
         for unsub in unsub_dispatchers:
             unsub()
@@ -20,7 +20,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([ParcelsAppBinarySensor(coordinator)], True)
+    async_add_entities([ParcelsAppBinarySensor(coordinator)])
 
 
 class ParcelsAppBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -31,7 +31,7 @@ class ParcelsAppBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator: ParcelsAppCoordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{DOMAIN}_status"
+        self._attr_unique_id = f"{coordinator.entry_id}_status"
         self._attr_name = "Parcels App Status"
 
     @property
@@ -49,5 +49,9 @@ class ParcelsAppBinarySensor(CoordinatorEntity, BinarySensorEntity):
             return {
                 "response_time": status_data["response_time"],
                 "response_code": status_data["response_code"],
+                "latency_p50": status_data["latency_p50"],
+                "latency_p95": status_data["latency_p95"],
+                "refresh_duration": self.coordinator.last_refresh_duration,
+                "circuit": self.coordinator.circuit.state,
             }
         return {}
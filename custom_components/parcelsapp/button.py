@@ -19,10 +19,11 @@ class ParcelsAppUpdateButton(ButtonEntity):
     def __init__(self, coordinator: ParcelsAppCoordinator) -> None:
         """Initialize the button."""
         self.coordinator = coordinator
-        self._attr_unique_id = f"{DOMAIN}_update_tracking"
+        self._attr_unique_id = f"{coordinator.entry_id}_update_tracking"
         self._attr_name = "Update Parcels App Tracking"
         self._attr_icon = "mdi:truck-delivery"
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.coordinator.update_tracked_packages()
+        await self.coordinator.update_tracked_packages(force=True)
+        self.coordinator.async_update_listeners()
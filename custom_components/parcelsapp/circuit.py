@@ -0,0 +1,100 @@
+"""Circuit breaker around the Parcels App API."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop calling the API after repeated failures, then let a trial request through.
+
+    The circuit opens after ``failure_threshold`` consecutive failures. Once
+    ``reset_timeout`` seconds have passed it is half-open: a single trial
+    request is allowed, closing the circuit on success or opening it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize a closed circuit, calling ``on_change`` when it opens or closes."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._on_change = on_change
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit."""
+        if self._opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and not self._trial:
+            # Only one trial request at a time
+            self._trial = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a request the API answered, closing the circuit."""
+        self._failures = 0
+        self._trial = False
+        if self._opened_at is not None:
+            self._opened_at = None
+            _LOGGER.info("Parcels App API is reachable again, resuming requests")
+            if self._on_change is not None:
+                self._on_change()
+
+    def record_throttled(self) -> None:
+        """Record a throttled request, neither a success nor a failure.
+
+        It ends the trial of a half-open circuit, so the next request can
+        try again once the throttling is over.
+        """
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        self._failures += 1
+        self._trial = False
+        if self._opened_at is not None:
+            # A failed trial keeps the circuit open for another timeout
+            self._opened_at = time.monotonic()
+        elif self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            _LOGGER.warning(
+                f"Parcels App API failed {self._failures} times in a row, "
+                f"pausing requests for {self._reset_timeout}s"
+            )
+            if self._on_change is not None:
+                self._on_change()
+
+    def as_dict(self) -> dict:
+        """Return the state of the circuit, for diagnostics."""
+        return {"state": self.state, "consecutive_failures": self._failures}
@@ -0,0 +1,28 @@
+"""JSON encoding and decoding for the Parcels App API and stores."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant ships orjson
+    orjson = None
+
+# orjson's decode error subclasses it, so callers only catch this one
+DecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document, straight from the response bytes when possible."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a JSON document to bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -5,10 +5,26 @@ from __future__ import annotations
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_API_KEY, CONF_DESTINATION_COUNTRY
+from .const import (
+    DOMAIN,
+    CONF_API_KEY,
+    CONF_DESTINATION_COUNTRY,
+    CONF_BATCH_SIZE,
+    DEFAULT_BATCH_SIZE,
+    MAX_BATCH_SIZE,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    MAX_CONCURRENCY,
+    CONF_ARCHIVE_AFTER,
+    DEFAULT_ARCHIVE_AFTER,
+    MAX_ARCHIVE_AFTER,
+    CONF_BASE_URL,
+    DEFAULT_BASE_URL,
+)
 
 
 class ParcelsAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -16,6 +32,14 @@ class ParcelsAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> ParcelsAppOptionsFlow:
+        """Get the options flow for this handler."""
+        return ParcelsAppOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, str] | None = None
     ) -> FlowResult:
@@ -50,3 +74,53 @@ class ParcelsAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class ParcelsAppOptionsFlow(config_entries.OptionsFlow):
+    """Handle Parcels App options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, int | str] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        # The handler is the entry ID, config_entry is only set from HA 2024.11
+        entry = self.hass.config_entries.async_get_entry(self.handler)
+        options = entry.options
+        errors = {}
+        if user_input is not None:
+            if CONF_BASE_URL not in user_input and CONF_BASE_URL in options:
+                # The field is only shown in advanced mode, keep its value
+                user_input[CONF_BASE_URL] = options[CONF_BASE_URL]
+            try:
+                if CONF_BASE_URL in user_input:
+                    user_input[CONF_BASE_URL] = cv.url(user_input[CONF_BASE_URL])
+            except vol.Invalid:
+                errors[CONF_BASE_URL] = "invalid_url"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+            options = {**options, **user_input}
+
+        schema = {
+            vol.Optional(
+                CONF_BATCH_SIZE,
+                default=options.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_BATCH_SIZE)),
+            vol.Optional(
+                CONF_MAX_CONCURRENCY,
+                default=options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENCY)),
+            vol.Optional(
+                CONF_ARCHIVE_AFTER,
+                default=options.get(CONF_ARCHIVE_AFTER, DEFAULT_ARCHIVE_AFTER),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_ARCHIVE_AFTER)),
+        }
+        if self.show_advanced_options:
+            schema[
+                vol.Optional(
+                    CONF_BASE_URL,
+                    default=options.get(CONF_BASE_URL, DEFAULT_BASE_URL),
+                )
+            ] = str
+        return self.async_show_form(
+            step_id="init", data_schema=vol.Schema(schema), errors=errors
+        )
@@ -6,3 +6,64 @@ CONF_DESTINATION_COUNTRY = "destination_country"
 DEFAULT_SCAN_INTERVAL = 900
 SERVICE_TRACK_PACKAGE = "track_package"
 SERVICE_REMOVE_PACKAGE = "remove_package"
+SERVICE_TRACK_PACKAGES = "track_packages"
+SERVICE_REMOVE_PACKAGES = "remove_packages"
+CONF_BATCH_SIZE = "batch_size"
+DEFAULT_BATCH_SIZE = 20
+MAX_BATCH_SIZE = 50
+CONF_MAX_CONCURRENCY = "max_concurrency"
+DEFAULT_MAX_CONCURRENCY = 5
+MAX_CONCURRENCY = 20
+PACKAGE_UPDATE_TIMEOUT = 60
+STORE_SAVE_DELAY = 10
+FINAL_STATUSES = ("delivered", "archived")
+FAST_POLL_STATUSES = ("pickup", "arrived", "pending")
+POLL_INTERVAL_FAST = 300
+POLL_INTERVAL_SLOW = 3600
+POLL_INTERVAL_IDLE = 21600
+SLOW_AFTER = 2 * 86400
+IDLE_AFTER = 7 * 86400
+STALE_AFTER = 30 * 86400
+UPDATE_TICK_INTERVAL = POLL_INTERVAL_FAST
+WARM_START_SPREAD = 3 * UPDATE_TICK_INTERVAL
+PENDING_POLL_INITIAL_DELAY = 2
+PENDING_POLL_MAX_DELAY = 120
+HEALTH_PROBE_INTERVAL = 900
+HEALTH_PROBE_TIMEOUT = 10
+HEALTH_LATENCY_SAMPLES = 100
+API_REQUEST_TIMEOUT = 30
+API_CONNECTION_LIMIT = 10
+API_DNS_CACHE_TTL = 300
+API_KEEPALIVE_TIMEOUT = 30
+API_RATE_LIMIT = 1
+API_RATE_BURST = 5
+API_MAX_RETRIES = 3
+API_RETRY_BASE_DELAY = 2
+API_MAX_RETRY_DELAY = 60
+API_RETRY_JITTER = 1
+
+HISTORY_MAX_EVENTS = 100
+SERVICE_GET_HISTORY = "get_history"
+
+CONF_ARCHIVE_AFTER = "archive_after"
+DEFAULT_ARCHIVE_AFTER = 7
+MAX_ARCHIVE_AFTER = 365
+ARCHIVE_SWEEP_INTERVAL = 3600
+SERVICE_RESTORE_PACKAGE = "restore_package"
+
+METRICS_CYCLE_SAMPLES = 100
+METRICS_HISTOGRAM_BUCKETS = (0.5, 1, 2, 5, 10, 30, 60)
+
+CONF_BASE_URL = "base_url"
+DEFAULT_BASE_URL = "https://parcelsapp.com"
+
+DATA_ENGINE = "engine"
+CONF_CONFIG_ENTRY_ID = "config_entry_id"
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 300
+
+SUMMARY_ARRIVING_STATUSES = ("arrived", "pickup")
+SUMMARY_NEXT_DELIVERIES = 5
+
+PUSH_SUBSCRIPTION_TIMEOUT = 86400
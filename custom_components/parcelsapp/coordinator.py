@@ -1,38 +1,160 @@
+import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import logging
+import random
 import time
-import json
 import aiohttp
 import async_timeout
+from yarl import URL
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import (
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    UPDATE_TICK_INTERVAL,
+    FINAL_STATUSES,
+    CONF_BATCH_SIZE,
+    DEFAULT_BATCH_SIZE,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    PACKAGE_UPDATE_TIMEOUT,
+    PENDING_POLL_INITIAL_DELAY,
+    PENDING_POLL_MAX_DELAY,
+    STORE_SAVE_DELAY,
+    API_REQUEST_TIMEOUT,
+    API_MAX_RETRIES,
+    API_RETRY_BASE_DELAY,
+    API_MAX_RETRY_DELAY,
+    API_RETRY_JITTER,
+    CONF_ARCHIVE_AFTER,
+    DEFAULT_ARCHIVE_AFTER,
+    ARCHIVE_SWEEP_INTERVAL,
+    CONF_BASE_URL,
+    DEFAULT_BASE_URL,
+    PUSH_SUBSCRIPTION_TIMEOUT,
+    WARM_START_SPREAD,
+)
+from . import codec
+from .circuit import STATE_CLOSED, STATE_HALF_OPEN, CircuitOpenError
+from .engine import ParcelsAppEngine
+from .history import PackageHistory
+from .metrics import RefreshMetrics, StoreSizeEstimate
+from .models import PackageRecord
+from .ratelimit import QuotaTracker
+from .scheduler import PackageScheduler, poll_interval, should_archive
+from .singleflight import SingleFlight
+from .summary import PackageSummary
 
 _LOGGER = logging.getLogger(__name__)
 
+# Single-flight keys of the two kinds of refresh and of the pending results poll
+_FULL_REFRESH = "full_refresh"
+_SCHEDULED_REFRESH = "scheduled_refresh"
+_PENDING_POLL = "pending_poll"
+
+
+def _split_shipments(shipments: list[dict], tracking_ids: list[str]) -> dict[str, dict]:
+    """Map the shipments of a batched API response back to their tracking IDs."""
+    by_tracking_id = {}
+    for shipment in shipments:
+        tracking_id = shipment.get("trackingId")
+        if tracking_id is None and len(tracking_ids) == 1:
+            tracking_id = tracking_ids[0]
+        if tracking_id in tracking_ids:
+            by_tracking_id[tracking_id] = shipment
+    return by_tracking_id
+
+
+def _retry_after(headers) -> float | None:
+    """Return the delay requested by a Retry-After header, in seconds."""
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
 class ParcelsAppCoordinator(DataUpdateCoordinator):
     """Custom coordinator for Parcels App."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, engine: ParcelsAppEngine
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=UPDATE_TICK_INTERVAL),
+            # Only notify listeners when the refresh produced different data
+            always_update=False,
         )
+        self.entry_id = entry.entry_id
+        self.engine = engine
         self.api_key = entry.data["api_key"]
         self.destination_country = entry.data["destination_country"]
-        self.session = aiohttp.ClientSession()
-        self.tracked_packages = {}
+        self.batch_size = entry.options.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE)
+        self.max_concurrency = entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+        self.base_url = entry.options.get(CONF_BASE_URL, DEFAULT_BASE_URL).rstrip("/")
+        # Grace period before delivered or expired packages are archived, in seconds
+        self.archive_after = entry.options.get(CONF_ARCHIVE_AFTER, DEFAULT_ARCHIVE_AFTER) * 86400
+        self.last_refresh_duration = None
+        # The connection pool and rate limit are shared by every entry, the
+        # health and circuit breaker by the entries using the same base URL
+        self.session = engine.session
+        self.rate_limiter = engine.rate_limiter
+        self.health = engine.health(self.base_url)
+        self.circuit = engine.circuit(self.base_url)
+        self.tracked_packages: dict[str, PackageRecord] = {}
+        self._store_dirty = False
+        # Number of refreshes running, changes are notified when the last one ends
+        self._updating = 0
+        # Guards changes to tracked_packages against refreshes applying results
+        self._packages_lock = asyncio.Lock()
+        self._refreshes = SingleFlight()
+        # Set once shut down, the unload of the entry calls async_shutdown again
+        self._shut_down = False
+        # Tracking IDs with a request in flight, so overlapping operations skip them
+        self._in_flight = SingleFlight()
+        # Bumped on every real package change, so refresh results compare unequal
+        self._revision = 0
+        self._package_listeners: dict[str, list[Callable[[], None]]] = {}
+        self._changed_packages: set[str] = set()
+        # Counters by status and carrier, updated with each saved package change
+        self.summary = PackageSummary()
+        self._summary_listeners: list[Callable[[], None]] = []
+        self._summary_changed = False
+        # Tracking sensors indexed by tracking ID, managed by the sensor platform
+        self.tracking_entities: dict[str, Entity] = {}
+        # Active packages still showing the data loaded from the Store at startup
+        self.cached_packages: set[str] = set()
+        self._started = datetime.now().isoformat()
+        self.scheduler = PackageScheduler()
+        # Monotonic time until which packages receive pushed updates instead of polls
+        self._push_until: dict[str, float] = {}
+        self.metrics = RefreshMetrics()
+        # Store sizes are estimated from the changed records, not by encoding everything
+        self._package_sizes = StoreSizeEstimate()
+        self._history_sizes = StoreSizeEstimate()
+        self._pending = {}
+        self._pending_delay = PENDING_POLL_INITIAL_DELAY
+        self._unsub_pending_poll = None
         self.store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_tracked_packages")
+        self.quota = QuotaTracker()
+        self.quota_store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_quota")
+        self.history = PackageHistory()
+        self.history_store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_history")
+        # Archived packages are only loaded to archive or restore some
+        self.archive_store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_archive")
+        self._last_archive_sweep = None
         # Get the first two letters of the language code
         language_code = (hass.config.language or 'en')[:2].lower()
         self.language = language_code
@@ -40,293 +162,869 @@ class ParcelsAppCoordinator(DataUpdateCoordinator):
     async def async_init(self):
         """Initialize the coordinator."""
         await self._load_tracked_packages()
+        for tracking_id, package in self.tracked_packages.items():
+            self.summary.update(tracking_id, package)
+        self.history = PackageHistory.from_dict(await self.history_store.async_load() or {})
+        self.history.compact(self.tracked_packages)
+        self._package_sizes.mark_changed(*self.tracked_packages)
+        self._history_sizes.mark_changed(*self.tracked_packages)
+        self.quota = QuotaTracker.from_dict(await self.quota_store.async_load() or {})
+        # Archive before the platforms are set up, so archived packages get no entity
+        await self._async_archive_packages()
+        # Active packages keep their polling interval across restarts. Overdue
+        # ones are spread over the first ticks instead of all polled at once.
+        now = datetime.now()
+        monotonic_now = time.monotonic()
+        self._started = now.isoformat()
+        for tracking_id, package in self.tracked_packages.items():
+            if package.status in FINAL_STATUSES:
+                continue
+            self.cached_packages.add(tracking_id)
+            interval = poll_interval(package, now)
+            if interval is None:
+                # Stale packages are not polled anymore
+                continue
+            delay = 0.0
+            if package.last_checked:
+                checked_ago = (now - datetime.fromisoformat(package.last_checked)).total_seconds()
+                delay = interval - checked_ago
+            if delay <= 0:
+                delay = random.uniform(0, WARM_START_SPREAD)
+            self.scheduler.schedule(tracking_id, monotonic_now + delay)
+
+    def _finish_polls(self, previous: dict[str, tuple]) -> None:
+        """Record changes of polled packages and schedule their next poll.
+
+        ``previous`` maps each polled tracking ID to its signature before the poll.
+        """
+        for tracking_id, signature in previous.items():
+            package = self.tracked_packages.get(tracking_id)
+            if package is not None and (
+                package.last_changed is None or package.signature != signature
+            ):
+                package.last_changed = datetime.now().isoformat()
+            if (
+                tracking_id in self.cached_packages
+                and package is not None
+                and (package.last_checked or "") >= self._started
+            ):
+                # First successful poll since startup, the sensor drops its cache age
+                self.cached_packages.discard(tracking_id)
+                self._changed_packages.add(tracking_id)
+            self._reschedule(tracking_id)
+        if not self._updating:
+            self._async_notify_changes()
+
+    def _reschedule(self, tracking_id: str) -> None:
+        """Schedule the next poll of a package from its current state."""
+        package = self.tracked_packages.get(tracking_id)
+        if package is None:
+            self.scheduler.remove(tracking_id)
+            return
+        now = time.monotonic()
+        interval = poll_interval(package, datetime.now())
+        due = None if interval is None else now + interval
+        push_until = self._push_until.get(tracking_id)
+        if push_until is not None:
+            if push_until > now:
+                # Pushed updates replace polling until they stop coming
+                due = None if due is None else max(due, push_until)
+            else:
+                del self._push_until[tracking_id]
+        self.scheduler.schedule(tracking_id, due)
 
     async def _load_tracked_packages(self):
         """Load tracked packages from persistent storage."""
         stored_data = await self.store.async_load()
         if stored_data:
-            # Convert uuid_timestamp back to datetime if it's stored as string
-            for package in stored_data.values():
-                if 'uuid_timestamp' in package and isinstance(package['uuid_timestamp'], str):
-                    package['uuid_timestamp'] = datetime.fromisoformat(package['uuid_timestamp'])
-            self.tracked_packages = stored_data
+            self.tracked_packages = {
+                tracking_id: PackageRecord.from_dict(package)
+                for tracking_id, package in stored_data.items()
+            }
         else:
             self.tracked_packages = {}
+        self.engine.watch(self, *self.tracked_packages)
 
-    async def _save_tracked_packages(self):
-        """Save tracked packages to persistent storage."""
-        # Convert uuid_timestamp to ISO format string before saving
-        for package in self.tracked_packages.values():
-            if 'uuid_timestamp' in package and isinstance(package['uuid_timestamp'], datetime):
-                package['uuid_timestamp'] = package['uuid_timestamp'].isoformat()
-        await self.store.async_save(self.tracked_packages)
-        await self.async_request_refresh()
+    def _data_to_save(self) -> dict:
+        """Return tracked packages in their persistent storage format."""
+        return {
+            tracking_id: package.as_dict()
+            for tracking_id, package in self.tracked_packages.items()
+        }
 
-    async def track_package(self, tracking_id: str, name: str = None) -> None:
-        """Track a new package or update an existing one."""
-        url = "https://parcelsapp.com/api/v3/shipments/tracking"
-        payload = json.dumps(
+    def _take_data_to_save(self) -> dict:
+        """Clear the dirty flag and return the data to write."""
+        self._store_dirty = False
+        data = self._data_to_save()
+        self.metrics.record_store_write(self._package_sizes.measure(data))
+        return data
+
+    def _history_data(self) -> dict:
+        """Return the checkpoint history to write."""
+        data = self.history.as_dict()
+        self.metrics.record_store_write(self._history_sizes.measure(data["packages"]))
+        return data
+
+    def _save_history(self, *tracking_ids: str) -> None:
+        """Schedule a save of the checkpoint history after packages' history changed."""
+        self._history_sizes.mark_changed(*tracking_ids)
+        self.history_store.async_delay_save(self._history_data, STORE_SAVE_DELAY)
+
+    async def _save_tracked_packages(self, *tracking_ids: str):
+        """Schedule a save of tracked packages to persistent storage.
+
+        Writes are coalesced: the store is only marked dirty here and written
+        once per refresh cycle, or after STORE_SAVE_DELAY seconds otherwise.
+        ``tracking_ids`` are the changed packages whose entities get notified.
+        """
+        self._store_dirty = True
+        self._revision += 1
+        self._package_sizes.mark_changed(*tracking_ids)
+        self._changed_packages.update(tracking_ids)
+        for tracking_id in tracking_ids:
+            if self.summary.update(tracking_id, self.tracked_packages.get(tracking_id)):
+                self._summary_changed = True
+        self.store.async_delay_save(self._take_data_to_save, STORE_SAVE_DELAY)
+        if not self._updating:
+            self._async_notify_changes()
+
+    @callback
+    def async_add_package_listener(
+        self, tracking_id: str, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of a single package, return a function to stop listening."""
+        listeners = self._package_listeners.setdefault(tracking_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._package_listeners.pop(tracking_id, None)
+
+        return remove_listener
+
+    @callback
+    def async_add_summary_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the summary, return a function to stop listening."""
+        self._summary_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._summary_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_changes(self) -> None:
+        """Push changed packages to their entities without a new network cycle.
+
+        Changes made while packages are being refreshed are published once,
+        when the refresh completes.
+        """
+        changed, self._changed_packages = self._changed_packages, set()
+        for tracking_id in changed:
+            for update_callback in list(self._package_listeners.get(tracking_id, ())):
+                update_callback()
+        if self._summary_changed:
+            self._summary_changed = False
+            for update_callback in list(self._summary_listeners):
+                update_callback()
+
+    async def async_flush_tracked_packages(self) -> None:
+        """Write pending tracked packages changes to persistent storage now."""
+        if self._store_dirty:
+            await self.store.async_save(self._take_data_to_save())
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled polls, flush pending changes and leave the shared engine."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        await super().async_shutdown()
+        # Refreshes run in their own task, they would outlive the entry otherwise
+        self._refreshes.cancel()
+        if self._unsub_pending_poll is not None:
+            self._unsub_pending_poll()
+            self._unsub_pending_poll = None
+        await self.async_flush_tracked_packages()
+        await self.quota_store.async_save(self.quota.as_dict())
+        await self.history_store.async_save(self._history_data())
+        # The shared session is closed by the engine once every entry is unloaded
+        self.engine.unregister(self.entry_id)
+
+    async def _post_shipments(self, tracking_ids: list[str]) -> bytes:
+        """POST a batch of tracking IDs and return the raw response body."""
+        url = f"{self.base_url}/api/v3/shipments/tracking"
+        payload = codec.dumps(
             {
                 "shipments": [
                     {
                         "trackingId": tracking_id,
                         "destinationCountry": self.destination_country,
                     }
+                    for tracking_id in tracking_ids
                 ],
                 "language": self.language,
                 "apiKey": self.api_key,
             }
         )
         headers = {"Content-Type": "application/json"}
+        return await self._api_request("POST", url, headers=headers, data=payload)
 
-        try:
-            async with self.session.post(
-                url, headers=headers, data=payload
-            ) as response:
-                response_text = await response.text()
-                response.raise_for_status()
-                data = json.loads(response_text)
-
-                existing_package_data = self.tracked_packages.get(tracking_id, {})
-                if "uuid" in data:
-                    # New tracking request
-                    package_data = {
-                        **existing_package_data,
-                        "status": "pending",
-                        "uuid": data["uuid"],
-                        "uuid_timestamp": datetime.now(),
-                        "message": "Tracking initiated",
-                        "last_updated": datetime.now().isoformat(),
-                        "name": name or existing_package_data.get("name"),
-                    }
-                    self.tracked_packages[tracking_id] = package_data
-                elif "shipments" in data and data["shipments"]:
-                    # Shipment data is returned directly
-                    shipment = data["shipments"][0]
-                    package_data = {
-                        **existing_package_data,
-                        "status": shipment.get("status", "unknown"),
-                        "uuid": None,
-                        "uuid_timestamp": None,
-                        "message": shipment.get("lastState", {}).get(
-                            "status", "No status available"
-                        ),
-                        "location": shipment.get("lastState", {}).get("location", "undefined"),
-                        "origin": shipment.get("origin"),
-                        "destination": shipment.get("destination"),
-                        "carrier": shipment.get("detectedCarrier", {}).get("name"),
-                        "days_in_transit": next(
-                            (
-                                attr["val"]
-                                for attr in shipment.get("attributes", [])
-                                if attr["l"] == "days_transit"
-                            ),
-                            None,
-                        ),
-                        "last_updated": datetime.now().isoformat(),
-                        "name": name or existing_package_data.get("name"),
-                    }
-                    self.tracked_packages[tracking_id] = package_data
-                else:
-                    _LOGGER.error(
-                        f"Unexpected API response for tracking ID {tracking_id}. Response: {response_text}"
-                    )
-                    return
-            await self._save_tracked_packages()
-        except aiohttp.ClientError as err:
-            _LOGGER.error(f"Error tracking package {tracking_id}: {err}")
-        except json.JSONDecodeError:
-            _LOGGER.error(
-                f"Failed to parse API response for tracking ID {tracking_id}. Response: {response_text}"
+    async def _api_request(self, method: str, url: str, **kwargs) -> bytes:
+        """Send a rate limited request to Parcels App and return the response body.
+
+        Throttled (429) and server error responses are retried with jittered
+        exponential back-off, honouring their Retry-After header.
+        """
+        endpoint = f"{method} {URL(url).path}"
+        attempt = 0
+        while True:
+            if not self.circuit.allow_request():
+                raise CircuitOpenError(f"Parcels App API is unavailable, {method} request not sent")
+            await self.rate_limiter.acquire()
+            self.metrics.http_calls += 1
+            self.quota.record(endpoint)
+            self.quota_store.async_delay_save(self.quota.as_dict, STORE_SAVE_DELAY)
+            start_time = time.monotonic()
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    # Bytes are decoded by the JSON codec directly, without a text copy
+                    response_body = await response.read()
+                    self.health.record(time.monotonic() - start_time, response.status)
+                    status = response.status
+                    if status >= 500:
+                        self.circuit.record_failure()
+                    elif status == 429:
+                        self.quota.record_throttled()
+                        self.circuit.record_throttled()
+                    else:
+                        self.circuit.record_success()
+                    if attempt >= API_MAX_RETRIES or (status != 429 and status < 500):
+                        response.raise_for_status()
+                        return response_body
+                    retry_delay = _retry_after(response.headers)
+            except aiohttp.ClientResponseError:
+                self.metrics.http_errors += 1
+                raise
+            except aiohttp.ClientError:
+                self.metrics.http_errors += 1
+                self.health.record(time.monotonic() - start_time, None)
+                self.circuit.record_failure()
+                raise
+            except asyncio.TimeoutError as err:
+                self.metrics.http_errors += 1
+                self.health.record(time.monotonic() - start_time, None)
+                self.circuit.record_failure()
+                raise aiohttp.ServerTimeoutError(
+                    f"Timeout after {API_REQUEST_TIMEOUT}s on {method} request"
+                ) from err
+
+            if retry_delay is None:
+                retry_delay = API_RETRY_BASE_DELAY * 2 ** attempt
+            retry_delay = min(retry_delay, API_MAX_RETRY_DELAY) + random.uniform(0, API_RETRY_JITTER)
+            if status == 429:
+                # Hold every other request too, they would be throttled as well
+                self.rate_limiter.block_for(retry_delay)
+            attempt += 1
+            self.metrics.retries += 1
+            _LOGGER.debug(
+                f"{endpoint} returned {status}, retry {attempt}/{API_MAX_RETRIES} in {retry_delay:.1f}s"
             )
+            await asyncio.sleep(retry_delay)
+
+    def _apply_shipment(
+        self, tracking_id: str, package: PackageRecord, shipment: dict, share: bool = True
+    ) -> bool:
+        """Update a package from a shipment and record its new checkpoints.
+
+        Returns True if the package changed. The history lives in its own Store,
+        so new checkpoints don't rewrite the tracked packages. Unless ``share``
+        is False, other entries tracking the package get the shipment too.
+        """
+        if self.history.append(tracking_id, shipment.get("states")):
+            self._save_history(tracking_id)
+        if share:
+            self.engine.share_shipment(self, tracking_id, shipment)
+        return package.apply_shipment(shipment)
+
+    async def async_receive_shipment(self, tracking_id: str, shipment: dict) -> None:
+        """Apply a shipment fetched by another entry tracking the same package."""
+        async with self._packages_lock:
+            package = self.tracked_packages.get(tracking_id)
+            if package is None:
+                return
+            previous = {tracking_id: package.signature}
+            changed = self._apply_shipment(tracking_id, package, shipment, share=False)
+            self._finish_polls(previous)
+        if changed:
+            await self._save_tracked_packages(tracking_id)
+
+    async def async_ingest_shipments(self, shipments: list[dict]) -> list[str]:
+        """Apply shipments pushed to the webhook, returning the tracking IDs updated.
+
+        Packages receiving pushed updates are not polled again until no update
+        was pushed for PUSH_SUBSCRIPTION_TIMEOUT.
+        """
+        updated = []
+        changed = []
+        async with self._packages_lock:
+            previous = {}
+            for shipment in shipments:
+                tracking_id = shipment["trackingId"]
+                package = self.tracked_packages.get(tracking_id)
+                if package is None:
+                    continue
+                previous.setdefault(tracking_id, package.signature)
+                if self._apply_shipment(tracking_id, package, shipment):
+                    changed.append(tracking_id)
+                self._push_until[tracking_id] = time.monotonic() + PUSH_SUBSCRIPTION_TIMEOUT
+                updated.append(tracking_id)
+            self._finish_polls(previous)
+        if changed:
+            await self._save_tracked_packages(*changed)
+        return updated
+
+    async def track_package(self, tracking_id: str, name: str = None) -> None:
+        """Track a new package or update an existing one."""
+        await self.track_packages({tracking_id: name})
+
+    async def track_packages(self, packages: dict[str, str | None]) -> dict[str, str]:
+        """Track new packages or update existing ones with batched API calls.
+
+        ``packages`` maps tracking IDs to optional sensor names. Returns the
+        resulting status of each tracking ID, or "error" if it could not be tracked.
+        IDs already being tracked or refreshed share that operation's result.
+        """
+        results = {}
+        with self._in_flight.claim(packages) as tracking_ids:
+            new_uuids = await self.get_new_uuids(tracking_ids) if tracking_ids else {}
+
+            pending = {}
+            now = datetime.now()
+            async with self._packages_lock:
+                for tracking_id in tracking_ids:
+                    if tracking_id not in new_uuids:
+                        results[tracking_id] = "error"
+                        continue
+                    uuid, uuid_timestamp, shipment = new_uuids[tracking_id]
+                    package = self.tracked_packages.get(tracking_id) or PackageRecord()
+                    if shipment:
+                        # Shipment data is returned directly
+                        self._apply_shipment(tracking_id, package, shipment)
+                        package.uuid = None
+                        package.uuid_timestamp = None
+                    else:
+                        # New tracking request
+                        package.status = "pending"
+                        package.uuid = uuid
+                        package.uuid_timestamp = uuid_timestamp
+                        package.message = "Tracking initiated"
+                        package.last_updated = now.isoformat()
+                        package.last_checked = package.last_updated
+                        pending.setdefault(uuid, []).append(tracking_id)
+                    package.last_changed = now.isoformat()
+                    package.name = packages[tracking_id] or package.name
+                    self.tracked_packages[tracking_id] = package
+                    self.engine.watch(self, tracking_id)
+                    self.cached_packages.discard(tracking_id)
+                    self._reschedule(tracking_id)
+                    results[tracking_id] = package.status
+
+            # Fetch the tracking results as soon as they are ready
+            for uuid, uuid_tracking_ids in pending.items():
+                self._add_pending(uuid, uuid_tracking_ids)
+
+        joined = [tracking_id for tracking_id in packages if tracking_id not in results]
+        if joined:
+            await self._in_flight.wait(joined)
+            for tracking_id in joined:
+                package = self.tracked_packages.get(tracking_id)
+                if package is None:
+                    results[tracking_id] = "error"
+                    continue
+                package.name = packages[tracking_id] or package.name
+                results[tracking_id] = package.status
+
+        tracked = [tracking_id for tracking_id, status in results.items() if status != "error"]
+        if tracked:
+            await self._save_tracked_packages(*tracked)
+        return {tracking_id: results[tracking_id] for tracking_id in packages}
 
     async def remove_package(self, tracking_id: str) -> None:
         """Remove a package from tracking."""
-        if tracking_id in self.tracked_packages:
-            del self.tracked_packages[tracking_id]
-            await self._save_tracked_packages()
+        await self.remove_packages([tracking_id])
+
+    async def remove_packages(self, tracking_ids: list[str]) -> dict[str, str]:
+        """Remove packages from tracking, returning "removed" or "not_found" per ID."""
+        results = {}
+        async with self._packages_lock:
+            for tracking_id in tracking_ids:
+                if tracking_id in self.tracked_packages:
+                    del self.tracked_packages[tracking_id]
+                    self.engine.unwatch(self, tracking_id)
+                    self._push_until.pop(tracking_id, None)
+                    self.scheduler.remove(tracking_id)
+                    self.cached_packages.discard(tracking_id)
+                    results[tracking_id] = "removed"
+                else:
+                    _LOGGER.warning(f"Tracking ID {tracking_id} not found in tracked packages.")
+                    results[tracking_id] = "not_found"
+
+        removed = [tracking_id for tracking_id, result in results.items() if result == "removed"]
+        if removed:
+            await self._save_tracked_packages(*removed)
+            self.history.remove(*removed)
+            self._save_history(*removed)
+        return results
+
+    async def _async_archive_packages(self) -> None:
+        """Move delivered and expired packages past their grace period to the archive."""
+        self._last_archive_sweep = time.monotonic()
+        now = datetime.now()
+        archived = [
+            tracking_id
+            for tracking_id, package in self.tracked_packages.items()
+            if should_archive(package, now, self.archive_after)
+        ]
+        if not archived:
+            return
+
+        archive = await self.archive_store.async_load() or {}
+        async with self._packages_lock:
+            for tracking_id in archived:
+                package = self.tracked_packages.pop(tracking_id)
+                self.engine.unwatch(self, tracking_id)
+                self._push_until.pop(tracking_id, None)
+                archive[tracking_id] = {
+                    "package": package.as_dict(),
+                    "history": self.history.pop(tracking_id),
+                }
+                self.scheduler.remove(tracking_id)
+                self.cached_packages.discard(tracking_id)
+        await self.archive_store.async_save(archive)
+        await self._save_tracked_packages(*archived)
+        self._save_history(*archived)
+        _LOGGER.debug(f"Archived {len(archived)} packages: {', '.join(archived)}")
+
+        # Notify sensor platform to remove the entities of archived packages
+        async_dispatcher_send(self.hass, f"{DOMAIN}_{self.entry_id}_remove_package", archived)
+
+        # Packages archived at startup have no entity yet, drop their registry entries
+        entity_registry = er.async_get(self.hass)
+        for tracking_id in archived:
+            if tracking_id in self.tracking_entities:
+                continue
+            entity_id = entity_registry.async_get_entity_id(
+                Platform.SENSOR, DOMAIN, self.tracking_unique_id(tracking_id)
+            )
+            if entity_id is not None:
+                entity_registry.async_remove(entity_id)
+
+    def tracking_unique_id(self, tracking_id: str) -> str:
+        """Return the unique ID of the sensor of a package."""
+        return f"{self.entry_id}_tracking_{tracking_id}"
+
+    async def restore_package(self, tracking_id: str) -> bool:
+        """Move a package back from the archive, returning False if it isn't archived."""
+        archive = await self.archive_store.async_load() or {}
+        archived = archive.pop(tracking_id, None)
+        if archived is None:
+            return False
+
+        async with self._packages_lock:
+            package = PackageRecord.from_dict(archived["package"])
+            # Restart the grace period, or the next sweep would archive it again
+            package.last_changed = datetime.now().isoformat()
+            self.tracked_packages[tracking_id] = package
+            self.engine.watch(self, tracking_id)
+            self.history.restore(tracking_id, archived.get("history", []))
+            self._reschedule(tracking_id)
+        await self.archive_store.async_save(archive)
+        await self._save_tracked_packages(tracking_id)
+        self._save_history(tracking_id)
+        return True
+
+    def _needs_new_uuid(self, tracking_id: str, uuid: str | None, uuid_timestamp: str | None) -> bool:
+        """Return True if the package has no UUID or its UUID is expired."""
+        if not uuid or not uuid_timestamp:
+            return True  # No UUID timestamp means we need a new UUID
+        # ISO timestamps sort chronologically, no need to parse them
+        if uuid_timestamp < (datetime.now() - timedelta(minutes=30)).isoformat():
+            _LOGGER.debug(f"UUID for {tracking_id} is expired.")
+            return True
+        return False
+
+    async def _apply_new_uuid_result(self, tracking_id: str, new_uuid_result: tuple) -> str | None:
+        """Store the result of a new UUID request for a package.
+
+        Returns the UUID to fetch shipment data from, or None if there is nothing
+        left to fetch for this package.
+        """
+        new_uuid, new_uuid_timestamp, shipment_data = new_uuid_result
+        package = self.tracked_packages.get(tracking_id)
+        if package is None:
+            return None  # Removed while the request was in flight
+        if shipment_data:
+            # Update package data with shipment data
+            if self._apply_shipment(tracking_id, package, shipment_data):
+                await self._save_tracked_packages(tracking_id)
+            return None  # Shipment data updated, no need to proceed further
+        elif new_uuid:
+            # Update uuid and uuid_timestamp
+            package.uuid = new_uuid
+            package.uuid_timestamp = new_uuid_timestamp
+            await self._save_tracked_packages(tracking_id)
+            return new_uuid
         else:
-            _LOGGER.warning(f"Tracking ID {tracking_id} not found in tracked packages.")
-
-    async def update_package(self, tracking_id: str, uuid: str | None, uuid_timestamp: datetime | None) -> None:
-        """Update a single package."""
-        # Ensure uuid_timestamp is a datetime object
-        if isinstance(uuid_timestamp, str):
-            uuid_timestamp = datetime.fromisoformat(uuid_timestamp)
-
-        # Check if UUID is expired
-        uuid_expired = False
-        if uuid_timestamp:
-            time_since_uuid = datetime.now() - uuid_timestamp
-            if time_since_uuid > timedelta(minutes=30):
-                uuid_expired = True
-                _LOGGER.debug(f"UUID for {tracking_id} is expired.")
+            _LOGGER.error(f"Failed to get new UUID or shipment data for {tracking_id}")
+            return None
+
+    async def update_tracked_packages(self, force: bool = False) -> None:
+        """Update tracked packages that are due for a poll, or every active one if forced.
+
+        Overlapping calls join the refresh of the same kind already in flight.
+        """
+        await self._refreshes.run(
+            _FULL_REFRESH if force else _SCHEDULED_REFRESH,
+            lambda: self._run_update(force),
+        )
+
+    async def _run_update(self, force: bool) -> None:
+        """Run a refresh, notifying changed packages once no refresh is running."""
+        self._updating += 1
+        try:
+            await self._update_tracked_packages(force)
+        finally:
+            self._updating -= 1
+            if not self._updating:
+                self._async_notify_changes()
+
+    async def _update_tracked_packages(self, force: bool) -> None:
+        """Refresh active packages, leaving those already in flight to their operation."""
+        if self.circuit.state != STATE_CLOSED:
+            # Due packages stay queued until the circuit closes again
+            _LOGGER.debug("Parcels App API is unavailable, skipping the refresh")
+            return
+        start_time = time.monotonic()
+        if force:
+            candidates = [
+                tracking_id
+                for tracking_id, package in self.tracked_packages.items()
+                if package.status not in FINAL_STATUSES
+            ]
         else:
-            uuid_expired = True  # No UUID timestamp means we need a new UUID
-
-        if uuid_expired or not uuid:
-            # Get a new UUID or shipment data without overwriting existing data
-            new_uuid, new_uuid_timestamp, shipment_data = await self.get_new_uuid(tracking_id)
-            if shipment_data:
-                # Update package data with shipment data
-                existing_package_data = self.tracked_packages.get(tracking_id, {})
-                package_data = {
-                    **existing_package_data,
-                    "status": shipment_data.get("status", "unknown"),
-                    "message": shipment_data.get("lastState", {}).get(
-                        "status", "No status available"
-                    ),
-                    "location": shipment_data.get("lastState", {}).get("location", "undefined"),
-                    "origin": shipment_data.get("origin"),
-                    "destination": shipment_data.get("destination"),
-                    "carrier": shipment_data.get("detectedCarrier", {}).get("name"),
-                    "days_in_transit": next(
-                        (
-                            attr["val"]
-                            for attr in shipment_data.get("attributes", [])
-                            if attr["l"] == "days_transit"
-                        ),
-                        None,
-                    ),
-                    "last_updated": datetime.now().isoformat(),
-                }
-                self.tracked_packages[tracking_id] = package_data
-                await self._save_tracked_packages()
-                return  # Shipment data updated, no need to proceed further
-            elif new_uuid:
-                # Update uuid and uuid_timestamp
-                package_data = self.tracked_packages.get(tracking_id, {})
-                package_data['uuid'] = new_uuid
-                package_data['uuid_timestamp'] = new_uuid_timestamp
-                self.tracked_packages[tracking_id] = package_data
-                await self._save_tracked_packages()
-                uuid = new_uuid
-                uuid_timestamp = new_uuid_timestamp
+            candidates = [
+                tracking_id
+                for tracking_id in self.scheduler.pop_due(start_time)
+                if tracking_id in self.tracked_packages
+            ]
+        # Packages also tracked by another entry are polled by their owner only
+        watched_elsewhere = [
+            tracking_id for tracking_id in candidates if self.engine.owner(tracking_id) is not self
+        ]
+        if watched_elsewhere:
+            for tracking_id in watched_elsewhere:
+                self._reschedule(tracking_id)
+            candidates = [
+                tracking_id for tracking_id in candidates if self.engine.owner(tracking_id) is self
+            ]
+        with self._in_flight.claim(candidates) as tracking_ids:
+            await self._refresh_packages(tracking_ids, start_time)
+        if force:
+            # Return once every active package is refreshed, by whichever operation
+            await self._in_flight.wait(candidates)
+
+    async def _refresh_packages(self, tracking_ids: list[str], start_time: float) -> None:
+        """Refresh the given packages, batching and parallelizing API calls."""
+        previous = {
+            tracking_id: self.tracked_packages[tracking_id].signature
+            for tracking_id in tracking_ids
+        }
+
+        # Request every missing or expired UUID up front in batched POSTs
+        by_uuid = {}
+        needs_uuid = []
+        for tracking_id in tracking_ids:
+            package = self.tracked_packages[tracking_id]
+            uuid = package.uuid
+            if self._needs_new_uuid(tracking_id, uuid, package.uuid_timestamp):
+                needs_uuid.append(tracking_id)
             else:
-                _LOGGER.error(f"Failed to get new UUID or shipment data for {tracking_id}")
-                return
+                # The UUID is still valid, no new tracking request needed
+                self.metrics.cache_hits += 1
+                by_uuid.setdefault(uuid, []).append(tracking_id)
+        with self.metrics.phase("new_uuids"):
+            if needs_uuid:
+                new_uuids = await self.get_new_uuids(needs_uuid)
+                async with self._packages_lock:
+                    for tracking_id in needs_uuid:
+                        uuid = await self._apply_new_uuid_result(
+                            tracking_id, new_uuids.get(tracking_id, (None, None, None))
+                        )
+                        if uuid:
+                            by_uuid.setdefault(uuid, []).append(tracking_id)
 
-        # Continue with updating package data using the UUID
-        # Fetch shipment data using the UUID
-        await self._fetch_shipment_data(tracking_id, uuid)
-
-    async def update_tracked_packages(self) -> None:
-        """Update all tracked packages."""
-        for tracking_id, package_data in self.tracked_packages.items():
-            if package_data.get("status") not in ["delivered", "archived"]:
-                await self.update_package(
-                    tracking_id,
-                    package_data.get("uuid"),
-                    package_data.get("uuid_timestamp"),
+        with self.metrics.phase("fetch"):
+            results = await self._fetch_uuids(by_uuid)
+        for (uuid, uuid_tracking_ids), result in zip(by_uuid.items(), results):
+            if isinstance(result, asyncio.TimeoutError):
+                _LOGGER.error(f"Timeout updating packages {', '.join(uuid_tracking_ids)}")
+            elif isinstance(result, Exception):
+                _LOGGER.error(
+                    f"Unexpected error updating packages {', '.join(uuid_tracking_ids)}: {result}"
                 )
+            elif result:
+                # Results not ready yet, let the pending poller pick them up
+                self._add_pending(uuid, result)
+
+        self._finish_polls(previous)
+
+        # Persist every change made during the cycle in a single write
+        with self.metrics.phase("save"):
+            await self.async_flush_tracked_packages()
+
+        self.last_refresh_duration = time.monotonic() - start_time
+        self.metrics.record_cycle(
+            self.last_refresh_duration,
+            len(tracking_ids),
+            len(self.tracked_packages) - len(tracking_ids),
+        )
+        _LOGGER.debug(
+            f"Refreshed {len(tracking_ids)} packages in {self.last_refresh_duration:.2f}s "
+            f"({len(needs_uuid)} new UUIDs, {len(by_uuid)} UUID lookups, "
+            f"concurrency {self.max_concurrency}, "
+            f"{len(self.scheduler)} scheduled)"
+        )
+
+    async def _fetch_uuids(self, by_uuid: dict[str, list[str]]) -> list:
+        """Fetch shipment data once per UUID, at most max_concurrency at a time.
+
+        Returns the result of ``_fetch_shipment_data`` for each UUID, in order,
+        or the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _fetch(uuid, uuid_tracking_ids):
+            async with semaphore:
+                async with async_timeout.timeout(PACKAGE_UPDATE_TIMEOUT):
+                    return await self._fetch_shipment_data(uuid, uuid_tracking_ids)
+
+        return await asyncio.gather(
+            *(_fetch(uuid, uuid_tracking_ids) for uuid, uuid_tracking_ids in by_uuid.items()),
+            return_exceptions=True,
+        )
 
     async def _async_update_data(self):
-        """Fetch data from API endpoint and update tracked packages."""
-        # First, update the Parcels App status
-        status_data = await self._fetch_parcels_app_status()
+        """Fetch data from API endpoint and update tracked packages.
+
+        Failures don't make the update fail: while the API is down, sensors keep
+        the last known data and are marked stale.
+        """
+        if self.circuit.state == STATE_HALF_OPEN:
+            # Try the API with the cheap probe before sending tracking requests again
+            with self.metrics.phase("probe"):
+                await self._fetch_parcels_app_status()
 
-        # Then, update all tracked packages
+        # Update tracked packages first, their API calls tell whether Parcels App is up
         await self.update_tracked_packages()
 
+        if time.monotonic() - self._last_archive_sweep >= ARCHIVE_SWEEP_INTERVAL:
+            with self.metrics.phase("archive"):
+                await self._async_archive_packages()
+
+        # Only probe Parcels App when no API call reached it for a while
+        if self.health.needs_probe():
+            with self.metrics.phase("probe"):
+                await self._fetch_parcels_app_status()
+
         # Combine the status data with tracked packages data
         return {
-            "parcels_app_status": status_data,
+            "parcels_app_status": self.health.as_dict(),
+            "circuit": self.circuit.state,
             "tracked_packages": self.tracked_packages,
+            "revision": self._revision,
+            "api_requests": self.quota.requests,
         }
 
-    async def _fetch_parcels_app_status(self):
-        """Fetch Parcels App status."""
+    async def _fetch_parcels_app_status(self) -> None:
+        """Probe Parcels App through the engine shared by every entry."""
+        self.metrics.http_calls += 1
         try:
-            start_time = time.time()
-            async with async_timeout.timeout(10):
-                async with self.session.get("https://parcelsapp.com/") as response:
-                    await response.text()  # Ensure the response is fully received
-                    response.raise_for_status()
-                    end_time = time.time()
-                    response_time = end_time - start_time
-                    return {
-                        "status": response.status == 200,
-                        "response_time": response_time,
-                        "response_code": response.status,
-                    }
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
+            await self.engine.async_probe(self.base_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.http_errors += 1
 
-    async def get_new_uuid(self, tracking_id: str):
-        """Get a new UUID for a tracking ID or update package data if shipment info is returned."""
-        url = "https://parcelsapp.com/api/v3/shipments/tracking"
-        payload = json.dumps(
-            {
-                "shipments": [
-                    {
-                        "trackingId": tracking_id,
-                        "destinationCountry": self.destination_country,
-                    }
-                ],
-                "language": self.language,
-                "apiKey": self.api_key,
-            }
-        )
-        headers = {"Content-Type": "application/json"}
+    async def get_new_uuids(self, tracking_ids: list[str]) -> dict:
+        """Request new UUIDs or shipment data for many tracking IDs in batched POSTs.
+
+        Tracking IDs are sent in chunks of ``batch_size``. Returns a mapping of
+        tracking ID to ``(uuid, uuid_timestamp, shipment)``. IDs whose request
+        failed are left out of the mapping.
+        """
+        results = {}
+        for start in range(0, len(tracking_ids), self.batch_size):
+            chunk = tracking_ids[start:start + self.batch_size]
+            response_body = None
+            try:
+                response_body = await self._post_shipments(chunk)
+                data = codec.loads(response_body)
+            except aiohttp.ClientError as err:
+                _LOGGER.error(f"Error getting new UUID for {', '.join(chunk)}: {err}")
+                continue
+            except codec.DecodeError:
+                _LOGGER.error(
+                    f"Failed to parse API response for tracking IDs {', '.join(chunk)}. Response: {response_body.decode(errors='replace')}"
+                )
+                continue
 
+            if "uuid" in data:
+                # One UUID covers every shipment of the batch
+                uuid_timestamp = datetime.now().isoformat()
+                for tracking_id in chunk:
+                    results[tracking_id] = (data["uuid"], uuid_timestamp, None)
+            elif "shipments" in data and data["shipments"]:
+                # Shipment data is returned directly, split it back per tracking ID
+                shipments = _split_shipments(data["shipments"], chunk)
+                for tracking_id in chunk:
+                    if tracking_id in shipments:
+                        results[tracking_id] = (None, None, shipments[tracking_id])
+                    else:
+                        _LOGGER.error(
+                            f"No shipment returned for tracking ID {tracking_id}. Response: {response_body.decode(errors='replace')}"
+                        )
+            else:
+                _LOGGER.error(
+                    f"Unexpected API response when getting new UUID for tracking IDs {', '.join(chunk)}. Response: {response_body.decode(errors='replace')}"
+                )
+        return results
+
+    async def _fetch_shipment_data(self, uuid: str, tracking_ids: list[str]) -> list[str]:
+        """Fetch shipment data using UUID and update package data.
+
+        Returns the tracking IDs whose results are not available yet.
+        """
+        url = f"{self.base_url}/api/v3/shipments/tracking?uuid={uuid}&apiKey={self.api_key}&language={self.language}"
+
+        response_body = None
         try:
-            async with self.session.post(
-                url, headers=headers, data=payload
-            ) as response:
-                response_text = await response.text()
-                response.raise_for_status()
-                data = json.loads(response_text)
-
-                if "uuid" in data:
-                    return data["uuid"], datetime.now(), None  # No shipment data
-                elif "shipments" in data and data["shipments"]:
-                    # Shipment data is returned directly
-                    shipment = data["shipments"][0]
-                    return None, None, shipment  # Return shipment data
-                else:
-                    _LOGGER.error(
-                        f"Unexpected API response when getting new UUID for tracking ID {tracking_id}. Response: {response_text}"
-                    )
-                    return None, None, None
+            response_body = await self._api_request("GET", url)
+            data = codec.loads(response_body)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Error getting new UUID for {tracking_id}: {err}")
-            return None, None, None
+            _LOGGER.error(f"Error updating packages {', '.join(tracking_ids)}: {err}")
+            return []
+        except codec.DecodeError:
+            _LOGGER.error(
+                f"Failed to parse API response for tracking IDs {', '.join(tracking_ids)}. Response: {response_body.decode(errors='replace')}"
+            )
+            return []
 
-    async def _fetch_shipment_data(self, tracking_id: str, uuid: str) -> None:
-        """Fetch shipment data using UUID and update package data."""
-        url = f"https://parcelsapp.com/api/v3/shipments/tracking?uuid={uuid}&apiKey={self.api_key}&language={self.language}"
+        if not (data.get("done") and data.get("shipments")):
+            _LOGGER.debug(f"Tracking data not yet available for {', '.join(tracking_ids)}")
+            return tracking_ids
 
-        try:
-            async with self.session.get(url) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                if data.get("done") and data.get("shipments"):
-                    shipment = data["shipments"][0]
-                    existing_package_data = self.tracked_packages.get(tracking_id, {})
-                    package_data = {
-                        **existing_package_data,
-                        "status": shipment.get("status", "unknown"),
-                        "message": shipment.get("lastState", {}).get(
-                            "status", "No status available"
-                        ),
-                        "location": shipment.get("lastState", {}).get("location", "undefined"),
-                        "origin": shipment.get("origin"),
-                        "destination": shipment.get("destination"),
-                        "carrier": shipment.get("detectedCarrier", {}).get("name"),
-                        "days_in_transit": next(
-                            (
-                                attr["val"]
-                                for attr in shipment.get("attributes", [])
-                                if attr["l"] == "days_transit"
-                            ),
-                            None,
-                        ),
-                        "last_updated": datetime.now().isoformat(),
-                    }
-                    self.tracked_packages[tracking_id] = package_data
-                    await self._save_tracked_packages()
+        shipments = _split_shipments(data["shipments"], tracking_ids)
+        async with self._packages_lock:
+            for tracking_id in tracking_ids:
+                shipment = shipments.get(tracking_id)
+                if shipment is None:
+                    _LOGGER.debug(f"No shipment returned for {tracking_id} with UUID {uuid}")
+                    continue
+                package = self.tracked_packages.get(tracking_id)
+                if package is None:
+                    continue  # Removed while the request was in flight
+                if self._apply_shipment(tracking_id, package, shipment):
+                    await self._save_tracked_packages(tracking_id)
                 else:
-                    _LOGGER.debug(f"Tracking data not yet available for {tracking_id}")
-        except aiohttp.ClientError as err:
-            _LOGGER.error(f"Error updating package {tracking_id}: {err}")
+                    _LOGGER.debug(f"No change for {tracking_id}")
+        return []
+
+    @callback
+    def async_circuit_changed(self) -> None:
+        """Rebuild every sensor when the API becomes unavailable or available again."""
+        self._revision += 1
+        self._changed_packages.update(self.tracked_packages)
+        if not self._updating:
+            self._async_notify_changes()
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of packages waiting for their tracking results."""
+        return sum(len(tracking_ids) for tracking_ids in self._pending.values())
+
+    def _add_pending(self, uuid: str, tracking_ids: list[str]) -> None:
+        """Queue tracking IDs whose UUID results are not ready yet."""
+        self._pending.setdefault(uuid, set()).update(tracking_ids)
+        # Newly queued results are checked quickly, restarting the back-off
+        if self._unsub_pending_poll is not None:
+            self._unsub_pending_poll()
+        self._pending_delay = PENDING_POLL_INITIAL_DELAY
+        self._unsub_pending_poll = async_call_later(
+            self.hass, self._pending_delay, self._async_poll_pending
+        )
+
+    async def _async_poll_pending(self, _now: datetime) -> None:
+        """Run the pending poll as a refresh, so that shutting down cancels it."""
+        await self._refreshes.run(_PENDING_POLL, self._poll_pending)
+
+    async def _poll_pending(self) -> None:
+        """Re-check pending UUIDs, backing off exponentially while they are not done."""
+        self._unsub_pending_poll = None
+        if self.circuit.state != STATE_CLOSED:
+            # Keep the pending results until the API is reachable again
+            self._unsub_pending_poll = async_call_later(
+                self.hass, PENDING_POLL_MAX_DELAY, self._async_poll_pending
+            )
+            return
+        pending, self._pending = self._pending, {}
+
+        candidates = {
+            uuid: [
+                tracking_id
+                for tracking_id in tracking_ids
+                if tracking_id in self.tracked_packages
+                # Expired UUIDs are renewed on the package's next scheduled poll
+                and self.tracked_packages[tracking_id].uuid == uuid
+                and not self._needs_new_uuid(
+                    tracking_id, uuid, self.tracked_packages[tracking_id].uuid_timestamp
+                )
+            ]
+            for uuid, tracking_ids in pending.items()
+        }
+        # Packages refreshed by another operation meanwhile are left to it
+        with self._in_flight.claim(
+            tracking_id for tracking_ids in candidates.values() for tracking_id in tracking_ids
+        ) as claimed:
+            claimed = set(claimed)
+            by_uuid = {}
+            previous = {}
+            for uuid, tracking_ids in candidates.items():
+                tracking_ids = [tracking_id for tracking_id in tracking_ids if tracking_id in claimed]
+                if tracking_ids:
+                    for tracking_id in tracking_ids:
+                        previous[tracking_id] = self.tracked_packages[tracking_id].signature
+                    by_uuid[uuid] = tracking_ids
+
+            results = await self._fetch_uuids(by_uuid)
+            for uuid, result in zip(by_uuid, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    # Still pending, checked again after the back-off
+                    _LOGGER.error(f"Timeout polling pending UUID {uuid}")
+                    self._pending.setdefault(uuid, set()).update(by_uuid[uuid])
+                elif isinstance(result, Exception):
+                    _LOGGER.error(f"Unexpected error polling pending UUID {uuid}: {result}")
+                elif result:
+                    self._pending.setdefault(uuid, set()).update(result)
+
+            self._finish_polls(previous)
+
+        if self._pending and self._unsub_pending_poll is None:
+            self._pending_delay = min(self._pending_delay * 2, PENDING_POLL_MAX_DELAY)
+            _LOGGER.debug(
+                f"{sum(len(ids) for ids in self._pending.values())} packages still pending, "
+                f"checking again in {self._pending_delay}s"
+            )
+            self._unsub_pending_poll = async_call_later(
+                self.hass, self._pending_delay, self._async_poll_pending
+            )
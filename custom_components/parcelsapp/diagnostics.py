@@ -0,0 +1,39 @@
+"""Diagnostics support for Parcels App."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, DOMAIN
+from .coordinator import ParcelsAppCoordinator
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ParcelsAppCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "packages": {
+            "tracked": len(coordinator.tracked_packages),
+            "scheduled": len(coordinator.scheduler),
+            "pending": coordinator.pending_count,
+            "cached": len(coordinator.cached_packages),
+        },
+        "last_refresh_duration": coordinator.last_refresh_duration,
+        "health": coordinator.health.as_dict(),
+        "circuit": coordinator.circuit.as_dict(),
+        "quota": coordinator.quota.as_dict(),
+        "metrics": coordinator.metrics.as_dict(),
+    }
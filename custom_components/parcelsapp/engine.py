@@ -0,0 +1,166 @@
+"""Tracking engine shared by every Parcels App config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+import async_timeout
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    API_CONNECTION_LIMIT,
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_REQUEST_TIMEOUT,
+    HEALTH_PROBE_TIMEOUT,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+)
+from .circuit import CircuitBreaker
+from .health import HealthMonitor
+from .ratelimit import TokenBucket
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from .coordinator import ParcelsAppCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session with a bounded connection pool."""
+    connector = aiohttp.TCPConnector(
+        limit_per_host=API_CONNECTION_LIMIT,
+        ttl_dns_cache=API_DNS_CACHE_TTL,
+        keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT),
+    )
+
+
+class ParcelsAppEngine:
+    """Connection pool, request rate limit and health probe shared by all entries.
+
+    Health and circuit breaker are kept per base URL, so an entry pointed at
+    a test server doesn't pause the requests of the others. The engine also
+    indexes which entries watch each tracking ID. The first entry watching a
+    package owns it and is the only one polling it, the others receive its
+    shipments.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the engine."""
+        self.hass = hass
+        self.session = _create_session()
+        self.rate_limiter = TokenBucket(API_RATE_LIMIT, API_RATE_BURST)
+        self._health: dict[str, HealthMonitor] = {}
+        self._circuits: dict[str, CircuitBreaker] = {}
+        self.coordinators: dict[str, ParcelsAppCoordinator] = {}
+        self._watchers: dict[str, list[ParcelsAppCoordinator]] = {}
+        self._probes = SingleFlight()
+
+    def health(self, base_url: str) -> HealthMonitor:
+        """Return the health monitor of an API base URL."""
+        if base_url not in self._health:
+            self._health[base_url] = HealthMonitor()
+        return self._health[base_url]
+
+    def circuit(self, base_url: str) -> CircuitBreaker:
+        """Return the circuit breaker of an API base URL."""
+        if base_url not in self._circuits:
+            self._circuits[base_url] = CircuitBreaker(
+                CIRCUIT_FAILURE_THRESHOLD,
+                CIRCUIT_RESET_TIMEOUT,
+                lambda: self._async_circuit_changed(base_url),
+            )
+        return self._circuits[base_url]
+
+    def register(self, entry_id: str, coordinator: ParcelsAppCoordinator) -> None:
+        """Add the coordinator of a config entry."""
+        self.coordinators[entry_id] = coordinator
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove the coordinator of a config entry and hand its packages over."""
+        coordinator = self.coordinators.pop(entry_id, None)
+        if coordinator is not None:
+            self.unwatch(coordinator, *list(coordinator.tracked_packages))
+
+    def watch(self, coordinator: ParcelsAppCoordinator, *tracking_ids: str) -> None:
+        """Index packages tracked by a coordinator."""
+        for tracking_id in tracking_ids:
+            watchers = self._watchers.setdefault(tracking_id, [])
+            if coordinator not in watchers:
+                watchers.append(coordinator)
+
+    def unwatch(self, coordinator: ParcelsAppCoordinator, *tracking_ids: str) -> None:
+        """Remove packages no longer tracked by a coordinator from the index."""
+        for tracking_id in tracking_ids:
+            watchers = self._watchers.get(tracking_id)
+            if watchers and coordinator in watchers:
+                watchers.remove(coordinator)
+                if not watchers:
+                    del self._watchers[tracking_id]
+
+    def watchers(self, tracking_id: str) -> list[ParcelsAppCoordinator]:
+        """Return the coordinators tracking a package, its owner first."""
+        return self._watchers.get(tracking_id, [])
+
+    def owner(self, tracking_id: str) -> ParcelsAppCoordinator | None:
+        """Return the coordinator polling a package."""
+        watchers = self._watchers.get(tracking_id)
+        return watchers[0] if watchers else None
+
+    def share_shipment(
+        self, source: ParcelsAppCoordinator, tracking_id: str, shipment: dict
+    ) -> None:
+        """Hand a fetched shipment to the other coordinators tracking the package."""
+        for coordinator in self._watchers.get(tracking_id, ()):
+            if coordinator is not source:
+                self.hass.async_create_task(
+                    coordinator.async_receive_shipment(tracking_id, shipment)
+                )
+
+    def _async_circuit_changed(self, base_url: str) -> None:
+        """Let the entries using a base URL refresh their sensors when its circuit changes."""
+        for coordinator in self.coordinators.values():
+            if coordinator.base_url == base_url:
+                coordinator.async_circuit_changed()
+
+    async def async_probe(self, base_url: str) -> None:
+        """Probe Parcels App with a lightweight HEAD request, once for all entries."""
+        await self._probes.run(base_url, lambda: self._probe(base_url))
+
+    async def _probe(self, base_url: str) -> None:
+        """Send the HEAD request and record its outcome."""
+        health = self.health(base_url)
+        circuit = self.circuit(base_url)
+        start_time = time.monotonic()
+        try:
+            async with async_timeout.timeout(HEALTH_PROBE_TIMEOUT):
+                async with self.session.head(f"{base_url}/") as response:
+                    health.record(time.monotonic() - start_time, response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug(f"Parcels App status probe failed: {err}")
+            health.record(time.monotonic() - start_time, None)
+            circuit.record_failure()
+            raise
+        # The probe is the trial request that closes a half-open circuit
+        if response.status < 500:
+            circuit.record_success()
+        else:
+            circuit.record_failure()
+
+    async def async_close(self) -> None:
+        """Cancel the status probe in flight and close the HTTP session."""
+        self._probes.cancel()
+        if not self.session.closed:
+            await self.session.close()
@@ -0,0 +1,55 @@
+"""Parcels App availability and latency tracking."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+
+from .const import HEALTH_PROBE_INTERVAL, HEALTH_LATENCY_SAMPLES
+
+
+class HealthMonitor:
+    """Track Parcels App availability from the responses of every API call."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self._latencies: deque[float] = deque(maxlen=HEALTH_LATENCY_SAMPLES)
+        self.available: bool | None = None
+        self.response_code: int | None = None
+        self.response_time: float | None = None
+        self.last_checked: float | None = None
+
+    def record(self, response_time: float, response_code: int | None) -> None:
+        """Record the outcome of a request, with None as code for a connection failure."""
+        self.last_checked = time.monotonic()
+        self.response_code = response_code
+        # Any answer short of a server error means the API is reachable
+        self.available = response_code is not None and response_code < 500
+        if response_code is not None:
+            self.response_time = response_time
+            self._latencies.append(response_time)
+
+    def needs_probe(self) -> bool:
+        """Return True if no request reached the API for a whole probe interval."""
+        return (
+            self.last_checked is None
+            or time.monotonic() - self.last_checked >= HEALTH_PROBE_INTERVAL
+        )
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given latency percentile over recent requests."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * percent / 100))
+        return latencies[index]
+
+    def as_dict(self) -> dict:
+        """Return the status in the shape exposed by the coordinator data."""
+        return {
+            "status": self.available,
+            "response_time": self.response_time,
+            "response_code": self.response_code,
+            "latency_p50": self.percentile(50),
+            "latency_p95": self.percentile(95),
+        }
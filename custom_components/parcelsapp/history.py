@@ -0,0 +1,97 @@
+"""Per-package event history for the Parcels App integration."""
+
+from __future__ import annotations
+
+from .const import HISTORY_MAX_EVENTS
+
+
+class PackageHistory:
+    """Append-only timeline of the checkpoints of every tracked package.
+
+    Events are kept as compact ``[date, status, location]`` lists, oldest
+    first, and deduplicated on their date and status.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._events: dict[str, list[list]] = {}
+        self._seen: dict[str, set[tuple]] = {}
+
+    def append(self, tracking_id: str, states: list[dict] | None) -> bool:
+        """Append the checkpoints of a shipment not seen yet.
+
+        ``states`` is the shipment's timeline as returned by the API. Returns
+        True if any new event was recorded.
+        """
+        if not states:
+            return False
+        seen = self._seen.setdefault(tracking_id, set())
+        new_events = []
+        for state in states:
+            key = (state.get("date"), state.get("status"))
+            if key in seen:
+                continue
+            seen.add(key)
+            new_events.append([key[0], key[1], state.get("location")])
+        if not new_events:
+            return False
+
+        # The API lists the newest checkpoint first
+        new_events.sort(key=lambda event: event[0] or "")
+        events = self._events.setdefault(tracking_id, [])
+        if events and (events[-1][0] or "") > (new_events[0][0] or ""):
+            # A late checkpoint goes before the existing tail, this is rare
+            events.extend(new_events)
+            events.sort(key=lambda event: event[0] or "")
+        else:
+            events.extend(new_events)
+        if len(events) > HISTORY_MAX_EVENTS:
+            del events[: len(events) - HISTORY_MAX_EVENTS]
+        return True
+
+    def timeline(self, tracking_id: str) -> list[dict]:
+        """Return the events of a package, oldest first."""
+        return [
+            {"date": date, "status": status, "location": location}
+            for date, status, location in self._events.get(tracking_id, ())
+        ]
+
+    def pop(self, tracking_id: str) -> list[list]:
+        """Remove and return the events of a package in their Store format."""
+        self._seen.pop(tracking_id, None)
+        return self._events.pop(tracking_id, [])
+
+    def restore(self, tracking_id: str, events: list[list]) -> None:
+        """Set the events of a package from their Store format."""
+        self._events[tracking_id] = [list(event) for event in events]
+        self._seen[tracking_id] = {(event[0], event[1]) for event in events}
+
+    def remove(self, *tracking_ids: str) -> None:
+        """Forget the history of packages."""
+        for tracking_id in tracking_ids:
+            self._events.pop(tracking_id, None)
+            self._seen.pop(tracking_id, None)
+
+    def compact(self, tracking_ids) -> None:
+        """Drop the history of packages not in ``tracking_ids`` and trim the others."""
+        self.remove(*(set(self._events) - set(tracking_ids)))
+        for events in self._events.values():
+            if len(events) > HISTORY_MAX_EVENTS:
+                del events[: len(events) - HISTORY_MAX_EVENTS]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PackageHistory:
+        """Restore the history from its Store format."""
+        history = cls()
+        for tracking_id, events in data.get("packages", {}).items():
+            history.restore(tracking_id, events)
+        return history
+
+    def as_dict(self) -> dict:
+        """Return the history in its Store format."""
+        # Events are never modified in place, copying the lists is enough
+        return {
+            "packages": {
+                tracking_id: list(events) for tracking_id, events in self._events.items()
+            }
+        }
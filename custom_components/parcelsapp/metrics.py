@@ -0,0 +1,118 @@
+"""Refresh instrumentation for the Parcels App integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+
+from . import codec
+from .const import METRICS_CYCLE_SAMPLES, METRICS_HISTOGRAM_BUCKETS
+
+
+class RefreshMetrics:
+    """Counters, phase timers and cycle durations of the coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.http_calls = 0
+        self.http_errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.store_writes = 0
+        self.store_bytes_written = 0
+        self.packages_polled = 0
+        self.packages_skipped = 0
+        # Duration of each phase in the latest cycle, and in total since startup
+        self.phases: dict[str, float] = {}
+        self.phase_totals: dict[str, float] = {}
+        self._cycles: deque[float] = deque(maxlen=METRICS_CYCLE_SAMPLES)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the refresh cycle."""
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - start_time
+            self.phases[name] = duration
+            self.phase_totals[name] = self.phase_totals.get(name, 0.0) + duration
+
+    def record_cycle(self, duration: float, polled: int, skipped: int) -> None:
+        """Record a finished refresh cycle."""
+        self._cycles.append(duration)
+        self.packages_polled += polled
+        self.packages_skipped += skipped
+
+    def record_store_write(self, size: int) -> None:
+        """Record a Store write of ``size`` bytes."""
+        self.store_writes += 1
+        self.store_bytes_written += size
+
+    def histogram(self) -> dict[str, int]:
+        """Return how many recent cycles fall in each duration bucket, in seconds."""
+        counts = dict.fromkeys((f"<={bound}" for bound in METRICS_HISTOGRAM_BUCKETS), 0)
+        counts[f">{METRICS_HISTOGRAM_BUCKETS[-1]}"] = 0
+        for duration in self._cycles:
+            for bound in METRICS_HISTOGRAM_BUCKETS:
+                if duration <= bound:
+                    counts[f"<={bound}"] += 1
+                    break
+            else:
+                counts[f">{METRICS_HISTOGRAM_BUCKETS[-1]}"] += 1
+        return counts
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given cycle duration percentile over recent cycles."""
+        if not self._cycles:
+            return None
+        durations = sorted(self._cycles)
+        return durations[min(len(durations) - 1, int(len(durations) * percent / 100))]
+
+    def as_dict(self) -> dict:
+        """Return every metric, for diagnostics and sensor attributes."""
+        return {
+            "http_calls": self.http_calls,
+            "http_errors": self.http_errors,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "store_writes": self.store_writes,
+            "store_bytes_written": self.store_bytes_written,
+            "packages_polled": self.packages_polled,
+            "packages_skipped": self.packages_skipped,
+            "phases": dict(self.phases),
+            "phase_totals": dict(self.phase_totals),
+            "cycles": len(self._cycles),
+            "cycle_p50": self.percentile(50),
+            "cycle_p95": self.percentile(95),
+            "cycle_histogram": self.histogram(),
+        }
+
+
+class StoreSizeEstimate:
+    """Estimated encoded size of a Store, re-measuring only the records that changed."""
+
+    def __init__(self) -> None:
+        """Initialize an empty estimate."""
+        self._sizes: dict[str, int] = {}
+        self._changed: set[str] = set()
+        self.total = 0
+
+    def mark_changed(self, *keys: str) -> None:
+        """Mark records to measure again on the next write."""
+        self._changed.update(keys)
+
+    def measure(self, records: dict) -> int:
+        """Return the estimated size of ``records``, encoding the changed ones only."""
+        for key in self._changed:
+            self.total -= self._sizes.pop(key, 0)
+            record = records.get(key)
+            if record is not None:
+                # Quoted key, colon and separating comma around the encoded record
+                size = len(key) + 4 + len(codec.dumps(record))
+                self._sizes[key] = size
+                self.total += size
+        self._changed.clear()
+        return self.total
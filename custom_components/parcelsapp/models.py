@@ -0,0 +1,119 @@
+"""Data models for the Parcels App integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class PackageRecord:
+    """A tracked package, as persisted in the Store and exposed as sensor attributes."""
+
+    status: str | None = None
+    uuid: str | None = None
+    # ISO string, kept in its stored form so saves need no conversion
+    uuid_timestamp: str | None = None
+    message: str | None = None
+    location: str | None = None
+    origin: str | None = None
+    destination: str | None = None
+    carrier: str | None = None
+    days_in_transit: int | str | None = None
+    last_updated: str | None = None
+    last_changed: str | None = None
+    last_checked: str | None = None
+    name: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PackageRecord:
+        """Build a record from its Store format."""
+        return cls(
+            status=data.get("status"),
+            uuid=data.get("uuid"),
+            uuid_timestamp=data.get("uuid_timestamp"),
+            message=data.get("message"),
+            location=data.get("location"),
+            origin=data.get("origin"),
+            destination=data.get("destination"),
+            carrier=data.get("carrier"),
+            days_in_transit=data.get("days_in_transit"),
+            last_updated=data.get("last_updated"),
+            last_changed=data.get("last_changed"),
+            last_checked=data.get("last_checked"),
+            name=data.get("name"),
+        )
+
+    def as_dict(self) -> dict:
+        """Return the record in its Store format."""
+        return {
+            "status": self.status,
+            "uuid": self.uuid,
+            "uuid_timestamp": self.uuid_timestamp,
+            "message": self.message,
+            "location": self.location,
+            "origin": self.origin,
+            "destination": self.destination,
+            "carrier": self.carrier,
+            "days_in_transit": self.days_in_transit,
+            "last_updated": self.last_updated,
+            "last_changed": self.last_changed,
+            "last_checked": self.last_checked,
+            "name": self.name,
+        }
+
+    @property
+    def signature(self) -> tuple:
+        """Return the fields whose change resets the package's polling back-off."""
+        return (self.status, self.message, self.location)
+
+    def apply_shipment(self, shipment: dict) -> bool:
+        """Update the record from a shipment returned by the API.
+
+        Returns True if any tracked field changed. An unchanged shipment only
+        refreshes ``last_checked``.
+        """
+        last_state = shipment.get("lastState") or {}
+        # Only days_transit is read from the attributes, stop at the first match
+        days_in_transit = None
+        for attribute in shipment.get("attributes") or ():
+            if attribute.get("l") == "days_transit":
+                days_in_transit = attribute.get("val")
+                break
+        content = (
+            shipment.get("status", "unknown"),
+            last_state.get("status", "No status available"),
+            last_state.get("location", "undefined"),
+            shipment.get("origin"),
+            shipment.get("destination"),
+            (shipment.get("detectedCarrier") or {}).get("name"),
+            days_in_transit,
+        )
+        now = datetime.now().isoformat()
+        self.last_checked = now
+        if content == self.content:
+            return False
+        (
+            self.status,
+            self.message,
+            self.location,
+            self.origin,
+            self.destination,
+            self.carrier,
+            self.days_in_transit,
+        ) = content
+        self.last_updated = now
+        return True
+
+    @property
+    def content(self) -> tuple:
+        """Return the fields filled from a shipment, to detect changes."""
+        return (
+            self.status,
+            self.message,
+            self.location,
+            self.origin,
+            self.destination,
+            self.carrier,
+            self.days_in_transit,
+        )
@@ -0,0 +1,93 @@
+"""Request rate limiting and quota accounting for the Parcels App API."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+import time
+
+
+class TokenBucket:
+    """Token bucket shared by every request sent to the API."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize the bucket with ``rate`` tokens per second, up to ``capacity``."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def block_for(self, seconds: float) -> None:
+        """Hold every request for ``seconds``, e.g. after a Retry-After header."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        # The lock hands out tokens in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class QuotaTracker:
+    """Count the requests sent to the API today, in total and per endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.day = date.today().isoformat()
+        self.requests = 0
+        self.throttled = 0
+        self.by_endpoint: dict[str, int] = {}
+
+    def _roll_over(self) -> None:
+        """Reset the counters when the day changed."""
+        today = date.today().isoformat()
+        if today != self.day:
+            self.day = today
+            self.requests = 0
+            self.throttled = 0
+            self.by_endpoint = {}
+
+    def record(self, endpoint: str) -> None:
+        """Count a request sent to ``endpoint``."""
+        self._roll_over()
+        self.requests += 1
+        self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + 1
+
+    def record_throttled(self) -> None:
+        """Count a request rejected by the API with a 429 response."""
+        self._roll_over()
+        self.throttled += 1
+
+    @classmethod
+    def from_dict(cls, data: dict) -> QuotaTracker:
+        """Restore counters from their Store format."""
+        tracker = cls()
+        if data.get("day") == tracker.day:
+            tracker.requests = data.get("requests", 0)
+            tracker.throttled = data.get("throttled", 0)
+            tracker.by_endpoint = dict(data.get("by_endpoint", {}))
+        return tracker
+
+    def as_dict(self) -> dict:
+        """Return the counters in their Store format."""
+        self._roll_over()
+        return {
+            "day": self.day,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "by_endpoint": dict(self.by_endpoint),
+        }
@@ -0,0 +1,99 @@
+"""Per-package polling scheduler for the Parcels App integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import heapq
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    FAST_POLL_STATUSES,
+    FINAL_STATUSES,
+    POLL_INTERVAL_FAST,
+    POLL_INTERVAL_SLOW,
+    POLL_INTERVAL_IDLE,
+    SLOW_AFTER,
+    IDLE_AFTER,
+    STALE_AFTER,
+)
+from .models import PackageRecord
+
+
+def poll_interval(package: PackageRecord, now: datetime) -> float | None:
+    """Return how many seconds to wait before polling a package again.
+
+    Returns None when the package should not be polled anymore.
+    """
+    status = package.status
+    if status in FINAL_STATUSES:
+        return None
+    if status in FAST_POLL_STATUSES:
+        return POLL_INTERVAL_FAST
+
+    last_changed = package.last_changed
+    if not last_changed:
+        return DEFAULT_SCAN_INTERVAL
+    unchanged_for = (now - datetime.fromisoformat(last_changed)).total_seconds()
+    if unchanged_for > STALE_AFTER:
+        return None
+    if unchanged_for > IDLE_AFTER:
+        return POLL_INTERVAL_IDLE
+    if unchanged_for > SLOW_AFTER:
+        return POLL_INTERVAL_SLOW
+    return DEFAULT_SCAN_INTERVAL
+
+
+def should_archive(package: PackageRecord, now: datetime, grace_period: float) -> bool:
+    """Return True if a delivered or expired package is past its grace period.
+
+    Expired packages are the active ones no longer polled, their grace period
+    starts when polling stops.
+    """
+    last_changed = package.last_changed or package.last_updated
+    if not last_changed:
+        return False
+    unchanged_for = (now - datetime.fromisoformat(last_changed)).total_seconds()
+    if package.status in FINAL_STATUSES:
+        return unchanged_for > grace_period
+    return unchanged_for > STALE_AFTER + grace_period
+
+
+class PackageScheduler:
+    """Priority queue of the next time each tracked package is due for a poll."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._queue: list[tuple[float, str]] = []
+        self._next_due: dict[str, float] = {}
+
+    def schedule(self, tracking_id: str, due: float | None) -> None:
+        """Set the time a package is next due, or stop polling it when None."""
+        if due is None:
+            self._next_due.pop(tracking_id, None)
+            return
+        self._next_due[tracking_id] = due
+        heapq.heappush(self._queue, (due, tracking_id))
+
+    def remove(self, tracking_id: str) -> None:
+        """Stop polling a package."""
+        self._next_due.pop(tracking_id, None)
+
+    def pop_due(self, now: float) -> list[str]:
+        """Remove and return every package due at or before ``now``."""
+        due_ids = []
+        while self._queue and self._queue[0][0] <= now:
+            due, tracking_id = heapq.heappop(self._queue)
+            # Skip entries superseded by a later schedule() or remove() call
+            if self._next_due.get(tracking_id) != due:
+                continue
+            del self._next_due[tracking_id]
+            due_ids.append(tracking_id)
+        return due_ids
+
+    def __contains__(self, tracking_id: str) -> bool:
+        """Return True if the package is scheduled."""
+        return tracking_id in self._next_due
+
+    def __len__(self) -> int:
+        """Return the number of scheduled packages."""
+        return len(self._next_due)
@@ -1,11 +1,15 @@
-from homeassistant.components.sensor import SensorEntity
+import asyncio
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .circuit import STATE_CLOSED
 from .const import DOMAIN
 from .coordinator import ParcelsAppCoordinator
 
@@ -16,48 +20,54 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for tracking_id, package_data in coordinator.tracked_packages.items():
-        sensor = ParcelsAppTrackingSensor(coordinator, tracking_id, package_data.get("name"))
-        entities.append(sensor)
-    async_add_entities(entities, True)
-
-    # Store a reference to the added entities
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id + "_entities"] = entities
-
-    # Listen for new packages to add
-    async def handle_new_package(tracking_id: str):
-        package_data = coordinator.tracked_packages.get(tracking_id)
-        if package_data:
-            new_sensor = ParcelsAppTrackingSensor(coordinator, tracking_id, package_data.get("name"))
-            async_add_entities([new_sensor], True)
-            # Add to entities list
-            hass.data[DOMAIN][entry.entry_id + "_entities"].append(new_sensor)
-
-    # Listen for packages to remove
-    async def handle_remove_package(tracking_id: str):
-        entities = hass.data[DOMAIN][entry.entry_id + "_entities"]
-        entity_to_remove = None
-        for entity in entities:
-            if entity.tracking_id == tracking_id:
-                entity_to_remove = entity
-                break
-        if entity_to_remove:
-            await entity_to_remove.async_remove()
-            entities.remove(entity_to_remove)
-
-            # Remove entity from entity registry
-            entity_registry = er.async_get(hass)
-            entity_id = entity_to_remove.entity_id
-            if entity_registry.async_is_registered(entity_id):
-                entity_registry.async_remove(entity_id)
+    @callback
+    def add_sensors(tracking_ids: list[str]) -> None:
+        """Add sensors for tracked packages that don't have one yet."""
+        new_sensors = []
+        for tracking_id in tracking_ids:
+            package = coordinator.tracked_packages.get(tracking_id)
+            if package is None or tracking_id in coordinator.tracking_entities:
+                continue
+            sensor = ParcelsAppTrackingSensor(coordinator, tracking_id, package.name)
+            coordinator.tracking_entities[tracking_id] = sensor
+            new_sensors.append(sensor)
+        if new_sensors:
+            # Package data is already loaded, no need to update before adding
+            async_add_entities(new_sensors)
+
+    async def remove_sensors(tracking_ids: list[str]) -> None:
+        """Remove the sensors of packages that are no longer tracked."""
+        entity_registry = er.async_get(hass)
+        removed = [
+            sensor
+            for sensor in (
+                coordinator.tracking_entities.pop(tracking_id, None)
+                for tracking_id in tracking_ids
+            )
+            if sensor is not None
+        ]
+        await asyncio.gather(*(sensor.async_remove() for sensor in removed))
+        # Remove entities from entity registry
+        for sensor in removed:
+            if entity_registry.async_is_registered(sensor.entity_id):
+                entity_registry.async_remove(sensor.entity_id)
+
+    async_add_entities(
+        [
+            ParcelsAppSummarySensor(coordinator),
+            ParcelsAppQuotaSensor(coordinator),
+            ParcelsAppRefreshDurationSensor(coordinator),
+            ParcelsAppHttpCallsSensor(coordinator),
+        ]
+    )
+    add_sensors(list(coordinator.tracked_packages))
 
+    # Listen for packages to add or remove
     unsub_new_package = async_dispatcher_connect(
-        hass, f"{DOMAIN}_new_package", handle_new_package
+        hass, f"{DOMAIN}_{entry.entry_id}_new_package", add_sensors
     )
     unsub_remove_package = async_dispatcher_connect(
-        hass, f"{DOMAIN}_remove_package", handle_remove_package
+        hass, f"{DOMAIN}_{entry.entry_id}_remove_package", remove_sensors
     )
 
     # Store unsub functions to clean up later
@@ -71,15 +81,49 @@ class ParcelsAppTrackingSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.tracking_id = tracking_id
-        self._attr_unique_id = f"tracking_{tracking_id}"
-        stored_name = self.coordinator.tracked_packages.get(tracking_id, {}).get("name")
-        self.name = name or stored_name or f"Parcel {tracking_id}"
+        self._attr_unique_id = coordinator.tracking_unique_id(tracking_id)
+        package = self.coordinator.tracked_packages.get(tracking_id)
+        stored_name = package.name if package else None
+        self._attr_name = name or stored_name or f"Parcel {tracking_id}"
+        self._attributes = None
+        self._was_available = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates of this sensor's package only."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_package_listener(
+                self.tracking_id, self._handle_package_update
+            )
+        )
+
+    @callback
+    def _handle_package_update(self) -> None:
+        """Handle a change of this sensor's package."""
+        self._attributes = None
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a coordinator refresh.
+
+        Package changes are pushed through the package listener, so only a
+        change of availability needs a state write here.
+        """
+        if self.available != self._was_available:
+            self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember the availability it was written with."""
+        self._was_available = self.available
+        super().async_write_ha_state()
 
     @property
     def state(self) -> str | None:
         """Return the state of the sensor."""
         if self.tracking_id in self.coordinator.tracked_packages:
-            return self.coordinator.tracked_packages[self.tracking_id].get("status")
+            return self.coordinator.tracked_packages[self.tracking_id].status
         return None
 
     @property
@@ -95,15 +139,24 @@ class ParcelsAppTrackingSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
-        """Return the state attributes."""
-        if self.tracking_id in self.coordinator.tracked_packages:
-            attributes = self.coordinator.tracked_packages[self.tracking_id].copy()
+        """Return the state attributes, rebuilt only when the package changed."""
+        if self.tracking_id not in self.coordinator.tracked_packages:
+            return {}
+        if self._attributes is None:
+            attributes = self.coordinator.tracked_packages[self.tracking_id].as_dict()
             # Convert last_updated to a more readable format
-            if 'last_updated' in attributes:
+            if attributes['last_updated']:
                 attributes['last_updated'] = attributes['last_updated'].replace('T', ' ')
             attributes['tracking_id'] = self.tracking_id
-            return attributes
-        return {}
+            if attributes['last_checked']:
+                if self.tracking_id in self.coordinator.cached_packages:
+                    # Loaded from the Store at startup and not refreshed yet
+                    attributes['cached_at'] = attributes['last_checked']
+                if self.coordinator.circuit.state != STATE_CLOSED:
+                    # Parcels App is unavailable, this is the last known state
+                    attributes['stale_since'] = attributes['last_checked']
+            self._attributes = attributes
+        return self._attributes
 
     @property
     def available(self) -> bool:
@@ -112,3 +165,135 @@ class ParcelsAppTrackingSensor(CoordinatorEntity, SensorEntity):
             self.coordinator.last_update_success
             and self.tracking_id in self.coordinator.tracked_packages
         )
+
+
+class ParcelsAppSummarySensor(CoordinatorEntity, SensorEntity):
+    """Number of active parcels, with counters by status and carrier."""
+
+    _attr_icon = "mdi:package-variant-closed"
+    _attr_native_unit_of_measurement = "parcels"
+
+    def __init__(self, coordinator: ParcelsAppCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry_id}_summary"
+        self._attr_name = "Parcels App Summary"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to summary changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_summary_listener(self.async_write_ha_state)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Ignore refreshes, the summary listener reports every change."""
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of parcels not delivered or archived yet."""
+        return self.coordinator.summary.active
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the counters and the parcels closest to delivery."""
+        return self.coordinator.summary.as_dict()
+
+
+class ParcelsAppQuotaSensor(CoordinatorEntity, SensorEntity):
+    """Number of requests sent to the Parcels App API today."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:counter"
+    _attr_native_unit_of_measurement = "requests"
+
+    def __init__(self, coordinator: ParcelsAppCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry_id}_api_requests_today"
+        self._attr_name = "Parcels App API Requests Today"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests sent today."""
+        return self.coordinator.quota.as_dict()["requests"]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the throttled requests and the per-endpoint counts."""
+        quota = self.coordinator.quota.as_dict()
+        return {
+            "day": quota["day"],
+            "throttled": quota["throttled"],
+            "by_endpoint": quota["by_endpoint"],
+        }
+
+
+class ParcelsAppRefreshDurationSensor(CoordinatorEntity, SensorEntity):
+    """Duration of the latest refresh cycle, disabled by default."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, coordinator: ParcelsAppCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry_id}_refresh_duration"
+        self._attr_name = "Parcels App Refresh Duration"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the latest refresh cycle."""
+        return self.coordinator.last_refresh_duration
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the phase timers and the distribution of recent cycles."""
+        metrics = self.coordinator.metrics.as_dict()
+        return {
+            "cycle_p50": metrics["cycle_p50"],
+            "cycle_p95": metrics["cycle_p95"],
+            "cycle_histogram": metrics["cycle_histogram"],
+            "phases": metrics["phases"],
+        }
+
+
+class ParcelsAppHttpCallsSensor(CoordinatorEntity, SensorEntity):
+    """Number of HTTP calls since startup, disabled by default."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:web"
+    _attr_native_unit_of_measurement = "calls"
+
+    def __init__(self, coordinator: ParcelsAppCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry_id}_http_calls"
+        self._attr_name = "Parcels App HTTP Calls"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of HTTP calls since startup."""
+        return self.coordinator.metrics.http_calls
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the other counters."""
+        metrics = self.coordinator.metrics.as_dict()
+        return {
+            key: metrics[key]
+            for key in (
+                "http_errors",
+                "retries",
+                "cache_hits",
+                "store_writes",
+                "store_bytes_written",
+                "packages_polled",
+                "packages_skipped",
+            )
+        }
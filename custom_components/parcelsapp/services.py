@@ -0,0 +1,244 @@
+"""Services of the Parcels App integration, shared by every config entry."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    DOMAIN,
+    DATA_ENGINE,
+    CONF_CONFIG_ENTRY_ID,
+    SERVICE_TRACK_PACKAGE,
+    SERVICE_REMOVE_PACKAGE,
+    SERVICE_TRACK_PACKAGES,
+    SERVICE_REMOVE_PACKAGES,
+    SERVICE_GET_HISTORY,
+    SERVICE_RESTORE_PACKAGE,
+)
+from .coordinator import ParcelsAppCoordinator
+from .engine import ParcelsAppEngine
+
+SERVICES = (
+    SERVICE_TRACK_PACKAGE,
+    SERVICE_REMOVE_PACKAGE,
+    SERVICE_TRACK_PACKAGES,
+    SERVICE_REMOVE_PACKAGES,
+    SERVICE_RESTORE_PACKAGE,
+    SERVICE_GET_HISTORY,
+)
+
+TRACK_PACKAGES_SCHEMA = vol.Schema(
+    {
+        vol.Required("tracking_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("names", default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+REMOVE_PACKAGES_SCHEMA = vol.Schema(
+    {
+        vol.Required("tracking_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+RESTORE_PACKAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("tracking_id"): cv.string,
+        vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("tracking_id"): cv.string,
+    }
+)
+
+
+def _engine(hass: HomeAssistant) -> ParcelsAppEngine:
+    """Return the engine shared by the loaded entries."""
+    return hass.data[DOMAIN][DATA_ENGINE]
+
+
+def _entry_coordinator(hass: HomeAssistant, entry_id: str) -> ParcelsAppCoordinator:
+    """Return the coordinator of a loaded config entry."""
+    coordinator = _engine(hass).coordinators.get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(f"Config entry {entry_id} is not loaded")
+    return coordinator
+
+
+def _tracking_coordinator(
+    hass: HomeAssistant, tracking_id: str, entry_id: str | None = None
+) -> ParcelsAppCoordinator:
+    """Return the coordinator to track a package with.
+
+    The given config entry comes first, then the entry already tracking the
+    package, then the first loaded entry.
+    """
+    if entry_id is not None:
+        return _entry_coordinator(hass, entry_id)
+    engine = _engine(hass)
+    return engine.owner(tracking_id) or next(iter(engine.coordinators.values()))
+
+
+def _watching_coordinators(
+    hass: HomeAssistant, tracking_id: str, entry_id: str | None = None
+) -> list[ParcelsAppCoordinator]:
+    """Return the coordinators a package is removed from."""
+    if entry_id is not None:
+        return [_entry_coordinator(hass, entry_id)]
+    return list(_engine(hass).watchers(tracking_id))
+
+
+def _signal(coordinator: ParcelsAppCoordinator, action: str) -> str:
+    """Return the dispatcher signal adding or removing the sensors of an entry."""
+    return f"{DOMAIN}_{coordinator.entry_id}_{action}_package"
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services once for every config entry."""
+    if hass.services.has_service(DOMAIN, SERVICE_TRACK_PACKAGE):
+        return
+
+    async def handle_track_package(call: ServiceCall) -> None:
+        tracking_id = call.data["tracking_id"]
+        name = call.data.get("name")
+        coordinator = _tracking_coordinator(
+            hass, tracking_id, call.data.get(CONF_CONFIG_ENTRY_ID)
+        )
+        await coordinator.track_package(tracking_id, name)
+
+        # Notify sensor platform to add the new entity
+        async_dispatcher_send(hass, _signal(coordinator, "new"), [tracking_id])
+
+    hass.services.async_register(DOMAIN, SERVICE_TRACK_PACKAGE, handle_track_package)
+
+    async def handle_remove_package(call: ServiceCall) -> None:
+        tracking_id = call.data["tracking_id"]
+        for coordinator in _watching_coordinators(
+            hass, tracking_id, call.data.get(CONF_CONFIG_ENTRY_ID)
+        ):
+            await coordinator.remove_package(tracking_id)
+
+            # Notify sensor platform to remove the entity
+            async_dispatcher_send(hass, _signal(coordinator, "remove"), [tracking_id])
+
+    hass.services.async_register(DOMAIN, SERVICE_REMOVE_PACKAGE, handle_remove_package)
+
+    async def handle_track_packages(call: ServiceCall) -> ServiceResponse:
+        tracking_ids = call.data["tracking_ids"]
+        names = call.data["names"]
+        if len(names) > len(tracking_ids):
+            raise ServiceValidationError("More names than tracking IDs were given")
+        packages = dict.fromkeys(tracking_ids)
+        packages.update(zip(tracking_ids, names))
+
+        # Batch the packages of each entry together
+        by_coordinator: dict[ParcelsAppCoordinator, dict[str, str | None]] = {}
+        for tracking_id, name in packages.items():
+            coordinator = _tracking_coordinator(
+                hass, tracking_id, call.data.get(CONF_CONFIG_ENTRY_ID)
+            )
+            by_coordinator.setdefault(coordinator, {})[tracking_id] = name
+
+        results = {}
+        for coordinator, coordinator_packages in by_coordinator.items():
+            results.update(await coordinator.track_packages(coordinator_packages))
+
+            # Notify sensor platform to add all the new entities at once
+            async_dispatcher_send(
+                hass, _signal(coordinator, "new"), list(coordinator_packages)
+            )
+        return {"results": {tracking_id: results[tracking_id] for tracking_id in packages}}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TRACK_PACKAGES,
+        handle_track_packages,
+        schema=TRACK_PACKAGES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_remove_packages(call: ServiceCall) -> ServiceResponse:
+        tracking_ids = call.data["tracking_ids"]
+        results = dict.fromkeys(tracking_ids, "not_found")
+
+        by_coordinator: dict[ParcelsAppCoordinator, list[str]] = {}
+        for tracking_id in tracking_ids:
+            for coordinator in _watching_coordinators(
+                hass, tracking_id, call.data.get(CONF_CONFIG_ENTRY_ID)
+            ):
+                by_coordinator.setdefault(coordinator, []).append(tracking_id)
+
+        for coordinator, coordinator_ids in by_coordinator.items():
+            for tracking_id, result in (
+                await coordinator.remove_packages(coordinator_ids)
+            ).items():
+                if result == "removed":
+                    results[tracking_id] = result
+
+            # Notify sensor platform to remove all the entities at once
+            async_dispatcher_send(hass, _signal(coordinator, "remove"), coordinator_ids)
+        return {"results": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REMOVE_PACKAGES,
+        handle_remove_packages,
+        schema=REMOVE_PACKAGES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_restore_package(call: ServiceCall) -> None:
+        tracking_id = call.data["tracking_id"]
+        entry_id = call.data.get(CONF_CONFIG_ENTRY_ID)
+        if entry_id is not None:
+            coordinators = [_entry_coordinator(hass, entry_id)]
+        else:
+            coordinators = list(_engine(hass).coordinators.values())
+        for coordinator in coordinators:
+            if await coordinator.restore_package(tracking_id):
+                # Notify sensor platform to add the restored entity
+                async_dispatcher_send(hass, _signal(coordinator, "new"), [tracking_id])
+                return
+        raise ServiceValidationError(f"Tracking ID {tracking_id} is not archived")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_PACKAGE,
+        handle_restore_package,
+        schema=RESTORE_PACKAGE_SCHEMA,
+    )
+
+    async def handle_get_history(call: ServiceCall) -> ServiceResponse:
+        tracking_id = call.data["tracking_id"]
+        coordinator = _engine(hass).owner(tracking_id)
+        if coordinator is None:
+            raise ServiceValidationError(f"Tracking ID {tracking_id} is not tracked")
+        return {"tracking_id": tracking_id, "events": coordinator.history.timeline(tracking_id)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        handle_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services once the last config entry is unloaded."""
+    for service in SERVICES:
+        hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,66 @@
+"""Sharing of in-flight operations between overlapping callers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+class SingleFlight:
+    """Let overlapping callers share one in-flight operation per key.
+
+    Whole operations are shared with ``run()``. Batched operations use
+    ``claim()`` to own each of their keys, so that overlapping batches can
+    skip those keys or ``wait()`` for them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the in-flight registry."""
+        self._futures: dict[Hashable, asyncio.Future] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if an operation is in flight for the key."""
+        return key in self._futures
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        """Forget the operation of a key, unless another one replaced it."""
+        if self._futures.get(key) is future:
+            del self._futures[key]
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func()`` unless an operation is in flight for the key, and return its result."""
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._futures[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        # A caller giving up must not cancel the operation for the others
+        return await asyncio.shield(future)
+
+    def cancel(self) -> None:
+        """Cancel the operations started by ``run()``, when shutting down."""
+        for future in list(self._futures.values()):
+            if isinstance(future, asyncio.Task):
+                future.cancel()
+
+    @contextmanager
+    def claim(self, keys: Iterable[Hashable]) -> Iterator[list]:
+        """Claim the keys that are not in flight yet, until the block exits."""
+        future = asyncio.get_running_loop().create_future()
+        claimed = [key for key in keys if key not in self._futures]
+        for key in claimed:
+            self._futures[key] = future
+        try:
+            yield claimed
+        finally:
+            for key in claimed:
+                self._release(key, future)
+            future.set_result(None)
+
+    async def wait(self, keys: Iterable[Hashable]) -> None:
+        """Wait until no operation is in flight for the keys."""
+        futures = {self._futures[key] for key in keys if key in self._futures}
+        if futures:
+            await asyncio.wait(futures)
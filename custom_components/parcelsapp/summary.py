@@ -0,0 +1,84 @@
+"""Aggregate counters over the tracked packages."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from .const import FINAL_STATUSES, SUMMARY_ARRIVING_STATUSES, SUMMARY_NEXT_DELIVERIES
+from .models import PackageRecord
+
+
+class PackageSummary:
+    """Counts of packages by status and carrier, updated one package at a time."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.by_status: Counter[str] = Counter()
+        self.by_carrier: Counter[str] = Counter()
+        # What each package contributes, to undo it when the package changes
+        self._entries: dict[str, tuple[str | None, str | None]] = {}
+        self._arriving: dict[str, PackageRecord] = {}
+
+    def update(self, tracking_id: str, package: PackageRecord | None) -> bool:
+        """Account for a changed or removed (None) package.
+
+        Returns True if the summary changed.
+        """
+        entry = None if package is None else (package.status, package.carrier)
+        old_entry = self._entries.get(tracking_id)
+        if package is not None and package.status in SUMMARY_ARRIVING_STATUSES:
+            self._arriving[tracking_id] = package
+        elif self._arriving.pop(tracking_id, None) is None and entry == old_entry:
+            return False
+
+        if old_entry is not None:
+            self._count(old_entry, -1)
+        if entry is None:
+            self._entries.pop(tracking_id, None)
+        else:
+            self._entries[tracking_id] = entry
+            self._count(entry, 1)
+        return True
+
+    def _count(self, entry: tuple[str | None, str | None], delta: int) -> None:
+        """Add ``delta`` to the counters of a package."""
+        status, carrier = entry
+        for counter, key in (
+            (self.by_status, status or "unknown"),
+            (self.by_carrier, carrier or "unknown"),
+        ):
+            counter[key] += delta
+            if not counter[key]:
+                del counter[key]
+
+    @property
+    def active(self) -> int:
+        """Return the number of packages not delivered or archived yet."""
+        return sum(
+            count for status, count in self.by_status.items() if status not in FINAL_STATUSES
+        )
+
+    def next_deliveries(self) -> list[dict]:
+        """Return the packages closest to delivery, waiting the longest first."""
+        arriving = sorted(
+            self._arriving.items(), key=lambda item: item[1].last_changed or ""
+        )[:SUMMARY_NEXT_DELIVERIES]
+        return [
+            {
+                "tracking_id": tracking_id,
+                "name": package.name,
+                "status": package.status,
+                "location": package.location,
+                "since": package.last_changed,
+            }
+            for tracking_id, package in arriving
+        ]
+
+    def as_dict(self) -> dict:
+        """Return the summary, for the summary sensor attributes."""
+        return {
+            "total": len(self._entries),
+            "by_status": dict(self.by_status),
+            "by_carrier": dict(self.by_carrier),
+            "next_deliveries": self.next_deliveries(),
+        }
@@ -0,0 +1,91 @@
+"""Webhook receiving shipment updates pushed to Parcels App entries."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+
+from aiohttp import web
+import voluptuous as vol
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import ParcelsAppCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Same shape as the tracking results returned by the API, the fields read
+# from a shipment are checked so a malformed push can't break its package
+SHIPMENT_SCHEMA = vol.Schema(
+    {
+        vol.Required("trackingId"): cv.string,
+        vol.Optional("status"): cv.string,
+        vol.Optional("origin"): vol.Any(None, cv.string),
+        vol.Optional("destination"): vol.Any(None, cv.string),
+        vol.Optional("lastState"): vol.Any(None, vol.Schema(dict)),
+        vol.Optional("detectedCarrier"): vol.Any(None, vol.Schema(dict)),
+        vol.Optional("states"): vol.Any(None, [vol.Schema(dict)]),
+        vol.Optional("attributes"): vol.Any(None, [vol.Schema(dict)]),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+WEBHOOK_SCHEMA = vol.Schema(
+    {
+        vol.Optional("done", default=True): cv.boolean,
+        vol.Required("shipments"): [SHIPMENT_SCHEMA],
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+@callback
+def async_setup_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: ParcelsAppCoordinator
+) -> None:
+    """Register the webhook of a config entry, creating its ID on first use."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if webhook_id is None:
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+        _LOGGER.info(
+            f"Shipment updates can be pushed to {webhook.async_generate_url(hass, webhook_id)}"
+        )
+
+    async def handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Apply the shipments of a pushed tracking result."""
+        try:
+            data = WEBHOOK_SCHEMA(await request.json())
+        except (ValueError, vol.Invalid) as err:
+            _LOGGER.warning(f"Invalid shipment update pushed to the webhook: {err}")
+            return web.json_response({"error": str(err)}, status=HTTPStatus.BAD_REQUEST)
+
+        if not data["done"]:
+            return web.json_response({"updated": [], "ignored": []})
+        updated = await coordinator.async_ingest_shipments(data["shipments"])
+        ignored = [
+            shipment["trackingId"]
+            for shipment in data["shipments"]
+            if shipment["trackingId"] not in updated
+        ]
+        return web.json_response({"updated": updated, "ignored": ignored})
+
+    # Updates may be pushed from outside the local network
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        "Parcels App shipment updates",
+        webhook_id,
+        handle_webhook,
+        local_only=False,
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
@@ -0,0 +1 @@
+"""Tests for the Parcels App integration."""
@@ -0,0 +1 @@
+"""Benchmarks of the Parcels App integration, run with ``pytest --benchmark``."""
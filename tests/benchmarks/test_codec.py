@@ -0,0 +1,136 @@
+"""JSON decoding and encoding of API responses and stores, codec against stdlib json."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import json
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.parcelsapp import codec
+from custom_components.parcelsapp.models import PackageRecord
+
+from ..conftest import stored_packages
+from ..stub_server import make_shipment
+
+pytestmark = pytest.mark.benchmark
+
+SHIPMENTS = 1000
+PACKAGES = 1000
+ROUNDS = 5
+
+
+def _measure(function) -> tuple[float, int]:
+    """Run ``function``, returning its best time over ROUNDS and its peak memory."""
+    durations = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(durations), peak
+
+
+def _report_pair(report, name: str, measures: dict[str, tuple[float, int]]) -> None:
+    """Report the time and peak memory of each way of doing ``name``."""
+    for variant, (duration, peak) in measures.items():
+        report(f"{name}, {variant}", time_ms=duration * 1e3, peak_kib=peak / 1024)
+
+
+def test_tracking_response(report):
+    """Decode and encode a tracking response listing 1000 shipments with long timelines."""
+    response = {
+        "done": True,
+        "shipments": [
+            make_shipment(f"PKG{index:05d}", checkpoints=50) for index in range(SHIPMENTS)
+        ],
+    }
+    body = json.dumps(response).encode()
+
+    def decode_stdlib_fallback():
+        with patch.object(codec, "orjson", None):
+            codec.loads(body)
+
+    decode = {
+        "codec": _measure(lambda: codec.loads(body)),
+        "codec, stdlib fallback": _measure(decode_stdlib_fallback),
+        # response.text() then json.loads, as requests used to be read
+        "text and json.loads": _measure(lambda: json.loads(body.decode())),
+    }
+    encode = {
+        "codec": _measure(lambda: codec.dumps(response)),
+        "json.dumps": _measure(lambda: json.dumps(response).encode()),
+    }
+    _report_pair(report, f"decode {SHIPMENTS} shipments", decode)
+    _report_pair(report, f"encode {SHIPMENTS} shipments", encode)
+
+    assert codec.loads(body) == response
+    if codec.orjson is not None:
+        assert decode["codec"][0] < decode["text and json.loads"][0]
+        assert encode["codec"][0] < encode["json.dumps"][0]
+
+
+def test_package_store(report):
+    """Save and load a store of 1000 packages, against the former per-record fix-up pass."""
+    data = stored_packages(PACKAGES, checked_ago=None)
+    for index, package in enumerate(data.values()):
+        package["uuid"] = f"uuid-{index}"
+        package["uuid_timestamp"] = datetime(2024, 1, 1, 8).isoformat()
+    packages = {
+        tracking_id: PackageRecord.from_dict(package) for tracking_id, package in data.items()
+    }
+    # The former live dicts kept uuid_timestamp as a datetime
+    legacy = {
+        tracking_id: {
+            **package,
+            "uuid_timestamp": datetime.fromisoformat(package["uuid_timestamp"]),
+        }
+        for tracking_id, package in data.items()
+    }
+
+    def save_records():
+        return codec.dumps(
+            {tracking_id: package.as_dict() for tracking_id, package in packages.items()}
+        )
+
+    def save_legacy():
+        to_save = {}
+        for tracking_id, package in legacy.items():
+            package = dict(package)
+            package["uuid_timestamp"] = package["uuid_timestamp"].isoformat()
+            to_save[tracking_id] = package
+        return json.dumps(to_save).encode()
+
+    stored = save_records()
+
+    def load_records():
+        return {
+            tracking_id: PackageRecord.from_dict(package)
+            for tracking_id, package in codec.loads(stored).items()
+        }
+
+    def load_legacy():
+        loaded = json.loads(stored.decode())
+        for package in loaded.values():
+            package["uuid_timestamp"] = datetime.fromisoformat(package["uuid_timestamp"])
+        return loaded
+
+    _report_pair(
+        report,
+        f"save {PACKAGES} packages",
+        {"records and codec": _measure(save_records), "fix-up and json": _measure(save_legacy)},
+    )
+    _report_pair(
+        report,
+        f"load {PACKAGES} packages",
+        {"records and codec": _measure(load_records), "fix-up and json": _measure(load_legacy)},
+    )
+
+    assert json.loads(stored) == json.loads(save_legacy())
+    assert load_records() == packages
@@ -0,0 +1,145 @@
+"""Shipment parsing into PackageRecord, compared with the former dict copies."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import time
+import tracemalloc
+
+import pytest
+
+from custom_components.parcelsapp.models import PackageRecord
+
+from ..conftest import stored_packages
+from ..stub_server import make_shipment
+
+pytestmark = pytest.mark.benchmark
+
+SHIPMENTS = 1000
+ROUNDS = 10
+
+
+def _large_shipments() -> list[dict]:
+    """Return shipments with long timelines and many attributes, days_transit last."""
+    shipments = []
+    for index in range(SHIPMENTS):
+        shipment = make_shipment(f"PKG{index:05d}", checkpoints=50)
+        days_transit = shipment["attributes"].pop(2)
+        shipment["attributes"].extend(
+            {"l": f"extra_{extra}", "n": f"Extra {extra}", "val": str(extra)}
+            for extra in range(20)
+        )
+        shipment["attributes"].append(days_transit)
+        shipments.append(shipment)
+    return shipments
+
+
+def _dict_update(existing: dict, shipment: dict) -> dict:
+    """Build the package dict the way the coordinator used to."""
+    return {
+        **existing,
+        "status": shipment.get("status", "unknown"),
+        "message": shipment.get("lastState", {}).get("status", "No status available"),
+        "location": shipment.get("lastState", {}).get("location", "undefined"),
+        "origin": shipment.get("origin"),
+        "destination": shipment.get("destination"),
+        "carrier": shipment.get("detectedCarrier", {}).get("name"),
+        "days_in_transit": next(
+            (
+                attr["val"]
+                for attr in shipment.get("attributes", [])
+                if attr["l"] == "days_transit"
+            ),
+            None,
+        ),
+        "last_updated": datetime.now().isoformat(),
+    }
+
+
+def _measure(candidates: dict, shipments: list[dict]) -> dict[str, tuple[float, int, int]]:
+    """Parse every shipment into the packages each candidate prepares.
+
+    ``candidates`` maps a name to its ``(prepare, parse)`` functions. Returns
+    the time per shipment and the memory kept and peak of each. Packages are
+    prepared outside the measure, as a refresh updates packages already
+    tracked, and rounds alternate so that load spikes hit every candidate.
+    """
+    durations = {name: [] for name in candidates}
+    for _ in range(ROUNDS):
+        for name, (prepare, parse) in candidates.items():
+            packages = prepare()
+            start = time.perf_counter()
+            parse(packages, shipments)
+            durations[name].append(time.perf_counter() - start)
+    results = {}
+    for name, (prepare, parse) in candidates.items():
+        packages = prepare()
+        tracemalloc.start()
+        parsed = parse(packages, shipments)
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del parsed
+        results[name] = (min(durations[name]) / len(shipments), kept, peak)
+    return results
+
+
+def test_parse_shipments(report):
+    """Parse large shipments into tracked records and into copies of tracked dicts."""
+    shipments = _large_shipments()
+    stored = list(stored_packages(SHIPMENTS, status="pickup").values())
+
+    def prepare_records():
+        return [PackageRecord.from_dict(package) for package in stored]
+
+    def parse_records(packages, shipments):
+        for package, shipment in zip(packages, shipments):
+            package.apply_shipment(shipment)
+        return packages
+
+    def prepare_dicts():
+        return [dict(package) for package in stored]
+
+    def parse_dicts(packages, shipments):
+        return [_dict_update(package, shipment) for package, shipment in zip(packages, shipments)]
+
+    results = _measure(
+        {"records": (prepare_records, parse_records), "dicts": (prepare_dicts, parse_dicts)},
+        shipments,
+    )
+    record_time, record_kept, record_peak = results["records"]
+    dict_time, dict_kept, dict_peak = results["dicts"]
+    report(
+        "parse shipment, PackageRecord",
+        us_per_shipment=record_time * 1e6,
+        kept_kib=record_kept / 1024,
+        peak_kib=record_peak / 1024,
+    )
+    report(
+        "parse shipment, dict copies",
+        us_per_shipment=dict_time * 1e6,
+        kept_kib=dict_kept / 1024,
+        peak_kib=dict_peak / 1024,
+    )
+    # Records are updated in place instead of copied on every refresh
+    assert record_kept < dict_kept
+    assert record_time < dict_time
+
+
+def test_unchanged_shipment(report):
+    """Apply a shipment that didn't change, the common case of a refresh."""
+    shipments = _large_shipments()
+    packages = [PackageRecord() for _ in shipments]
+    for package, shipment in zip(packages, shipments):
+        package.apply_shipment(shipment)
+
+    durations = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        changed = [
+            package.apply_shipment(shipment) for package, shipment in zip(packages, shipments)
+        ]
+        durations.append(time.perf_counter() - start)
+    per_shipment = min(durations) / len(shipments)
+
+    report("apply unchanged shipment", us_per_shipment=per_shipment * 1e6)
+    assert not any(changed)
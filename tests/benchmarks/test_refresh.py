@@ -0,0 +1,134 @@
+"""Refresh cycles over synthetic parcels, against the local stub server."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import math
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.parcelsapp.const import DEFAULT_BATCH_SIZE, PENDING_POLL_INITIAL_DELAY
+
+from ..conftest import add_entry, setup_entry, stored_packages, unload_entry
+
+pytestmark = pytest.mark.benchmark
+
+
+async def _timed_refresh(coordinator) -> tuple[float, int]:
+    """Run a refresh of every active parcel, returning its wall time and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    await coordinator.update_tracked_packages(force=True)
+    wall_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return wall_time, peak
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+async def test_refresh_cycle(hass, hass_storage, parcelsapp_stub, unlimited_rate, report, count):
+    """Refresh every parcel once, reporting requests, wall time, Store writes and memory."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(count))
+    coordinator = await setup_entry(hass, entry)
+    parcelsapp_stub.reset_counts()
+    store_writes = coordinator.metrics.store_writes
+
+    wall_time, peak = await _timed_refresh(coordinator)
+
+    batches = math.ceil(count / DEFAULT_BATCH_SIZE)
+    report(
+        f"refresh {count} parcels",
+        requests=parcelsapp_stub.total_requests,
+        wall_time_s=wall_time,
+        store_writes=coordinator.metrics.store_writes - store_writes,
+        peak_memory_kib=peak / 1024,
+    )
+    # One tracking request and one result request per batch, never more
+    assert parcelsapp_stub.requests == {
+        "POST /api/v3/shipments/tracking": batches,
+        "GET /api/v3/shipments/tracking": batches,
+    }
+    assert max(parcelsapp_stub.tracking_ids_requested.values()) == 1
+
+    # UUIDs are still valid, the next cycle only fetches their results
+    parcelsapp_stub.reset_counts()
+    wall_time, peak = await _timed_refresh(coordinator)
+    report(
+        f"refresh {count} parcels, cached UUIDs",
+        requests=parcelsapp_stub.total_requests,
+        wall_time_s=wall_time,
+        peak_memory_kib=peak / 1024,
+    )
+    assert parcelsapp_stub.requests == {"GET /api/v3/shipments/tracking": batches}
+
+    await unload_entry(hass, entry)
+
+
+async def test_refresh_cycle_degraded_api(
+    hass, hass_storage, parcelsapp_stub, unlimited_rate, report
+):
+    """Refresh 100 parcels with API latency, a server error and a throttled request."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(100))
+    coordinator = await setup_entry(hass, entry)
+    parcelsapp_stub.reset_counts()
+    parcelsapp_stub.latency = 0.05
+    parcelsapp_stub.errors = [500, 429]
+
+    with (
+        patch("custom_components.parcelsapp.coordinator.API_RETRY_BASE_DELAY", 0),
+        patch("custom_components.parcelsapp.coordinator.API_RETRY_JITTER", 0),
+    ):
+        wall_time, peak = await _timed_refresh(coordinator)
+
+    report(
+        "refresh 100 parcels, degraded API",
+        requests=parcelsapp_stub.total_requests,
+        retries=coordinator.metrics.retries,
+        wall_time_s=wall_time,
+        peak_memory_kib=peak / 1024,
+    )
+    # Both errors were retried, every parcel got its results
+    assert coordinator.metrics.retries == 2
+    assert parcelsapp_stub.total_requests == 2 * 5 + 2
+    assert all(package.uuid for package in coordinator.tracked_packages.values())
+
+    await unload_entry(hass, entry)
+
+
+async def test_refresh_cycle_pending_results(
+    hass, hass_storage, parcelsapp_stub, unlimited_rate, report
+):
+    """Refresh 100 parcels whose results take two more polls to be ready."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(100))
+    coordinator = await setup_entry(hass, entry)
+    parcelsapp_stub.reset_counts()
+    parcelsapp_stub.pending_polls = 2
+
+    wall_time, _ = await _timed_refresh(coordinator)
+    assert coordinator.pending_count == 100
+
+    # The pending poller backs off, doubling its delay
+    delay = 0
+    for attempt in range(2):
+        delay += PENDING_POLL_INITIAL_DELAY * 2 ** attempt
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=delay))
+        await hass.async_block_till_done()
+
+    report(
+        "refresh 100 parcels, pending results",
+        requests=parcelsapp_stub.total_requests,
+        wall_time_s=wall_time,
+    )
+    assert coordinator.pending_count == 0
+    assert parcelsapp_stub.requests == {
+        "POST /api/v3/shipments/tracking": 5,
+        "GET /api/v3/shipments/tracking": 3 * 5,
+    }
+
+    await unload_entry(hass, entry)
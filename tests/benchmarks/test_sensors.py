@@ -0,0 +1,65 @@
+"""State writes of tracking sensors per refresh, with a few hundred sensors."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.parcelsapp.sensor import ParcelsAppTrackingSensor
+
+from ..conftest import add_entry, setup_entry, stored_packages, unload_entry
+
+pytestmark = pytest.mark.benchmark
+
+SENSORS = 300
+CHANGED = 3
+
+
+async def test_sensor_writes_per_refresh(
+    hass, hass_storage, parcelsapp_stub, unlimited_rate, report
+):
+    """Refresh every parcel while a few of them change, counting sensor state writes."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(SENSORS))
+    coordinator = await setup_entry(hass, entry)
+    # The first refresh drops the cached state of every sensor
+    await coordinator.update_tracked_packages(force=True)
+    await hass.async_block_till_done()
+    parcelsapp_stub.statuses = {f"PKG{index:05d}": "pickup" for index in range(CHANGED)}
+
+    written = []
+    write_state = ParcelsAppTrackingSensor.async_write_ha_state
+
+    def count_writes(sensor: ParcelsAppTrackingSensor) -> None:
+        written.append(sensor.tracking_id)
+        write_state(sensor)
+
+    with patch.object(ParcelsAppTrackingSensor, "async_write_ha_state", count_writes):
+        start = time.perf_counter()
+        await coordinator.update_tracked_packages(force=True)
+        await hass.async_block_till_done()
+        targeted_time = time.perf_counter() - start
+
+        # What every refresh cost when each sensor rebuilt and wrote its state
+        written_before = len(written)
+        start = time.perf_counter()
+        for sensor in coordinator.tracking_entities.values():
+            sensor._attributes = None
+            sensor.async_write_ha_state()
+        broadcast_time = time.perf_counter() - start
+        broadcast_writes = len(written) - written_before
+
+    report(
+        f"refresh {SENSORS} sensors, {CHANGED} changed",
+        sensor_writes=written_before,
+        refresh_s=targeted_time,
+    )
+    report(
+        f"write all {SENSORS} sensors",
+        sensor_writes=broadcast_writes,
+        writes_s=broadcast_time,
+    )
+    assert sorted(written[:written_before]) == sorted(parcelsapp_stub.statuses)
+
+    await unload_entry(hass, entry)
@@ -0,0 +1,160 @@
+"""Fixtures for the Parcels App tests and benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.parcelsapp.const import (
+    CONF_API_KEY,
+    CONF_BASE_URL,
+    CONF_DESTINATION_COUNTRY,
+    DOMAIN,
+)
+from custom_components.parcelsapp.coordinator import ParcelsAppCoordinator
+
+from .stub_server import ParcelsAppStub
+
+BENCHMARK_RESULTS: list[tuple[str, dict]] = []
+
+RECENTLY_CHECKED = timedelta(minutes=1)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option running the benchmarks."""
+    parser.addoption(
+        "--benchmark", action="store_true", default=False, help="run the benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the benchmarks unless they were asked for."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the benchmark marker."""
+    config.addinivalue_line("markers", "benchmark: performance benchmark, run with --benchmark")
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """Print the figures reported by the benchmarks."""
+    if not BENCHMARK_RESULTS:
+        return
+    terminalreporter.section("Parcels App benchmarks")
+    for name, figures in BENCHMARK_RESULTS:
+        terminalreporter.write_line(
+            f"{name:<40} "
+            + "  ".join(f"{key}={value}" for key, value in figures.items())
+        )
+
+
+@pytest.fixture
+def report():
+    """Return a function recording the figures of a benchmark."""
+
+    def _report(name: str, **figures) -> None:
+        BENCHMARK_RESULTS.append(
+            (
+                name,
+                {
+                    key: f"{value:.4g}" if isinstance(value, float) else value
+                    for key, value in figures.items()
+                },
+            )
+        )
+
+    return _report
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the integration in every test."""
+    yield
+
+
+@pytest.fixture
+def unlimited_rate():
+    """Lift the API rate limit, so tests and benchmarks don't wait for tokens."""
+    with (
+        patch("custom_components.parcelsapp.engine.API_RATE_LIMIT", 10000),
+        patch("custom_components.parcelsapp.engine.API_RATE_BURST", 10000),
+    ):
+        yield
+
+
+@pytest.fixture
+async def parcelsapp_stub(socket_enabled) -> AsyncIterator[ParcelsAppStub]:
+    """Serve a fake Parcels App API on localhost."""
+    stub = ParcelsAppStub()
+    await stub.start()
+    yield stub
+    await stub.stop()
+
+
+def stored_packages(
+    count: int, status: str = "transit", checked_ago: timedelta | None = RECENTLY_CHECKED
+) -> dict:
+    """Return ``count`` tracked packages in their Store format.
+
+    ``checked_ago`` is the timedelta since their last check, they were never
+    checked when it is None. Packages checked recently are not due at setup,
+    so the first refresh doesn't poll a random part of them.
+    """
+    now = datetime.now()
+    checked = None if checked_ago is None else (now - checked_ago).isoformat()
+    return {
+        f"PKG{index:05d}": {
+            "status": status,
+            "message": f"Checkpoint 4 for PKG{index:05d}",
+            "location": "Hub 4",
+            "origin": "China",
+            "destination": "France",
+            "carrier": "La Poste",
+            "days_in_transit": "2",
+            "last_updated": checked,
+            "last_changed": checked,
+            "last_checked": checked,
+            "name": None,
+        }
+        for index in range(count)
+    }
+
+
+def add_entry(hass, base_url: str, hass_storage: dict, packages: dict | None = None, **options):
+    """Add a config entry using ``base_url``, with ``packages`` already stored."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_API_KEY: "test-key", CONF_DESTINATION_COUNTRY: "France"},
+        options={CONF_BASE_URL: base_url, **options},
+    )
+    entry.add_to_hass(hass)
+    if packages is not None:
+        key = f"{DOMAIN}_{entry.entry_id}_tracked_packages"
+        hass_storage[key] = {"version": 1, "minor_version": 1, "key": key, "data": packages}
+    return entry
+
+
+async def setup_entry(hass, entry) -> ParcelsAppCoordinator:
+    """Set up a config entry and wait for its first refresh, running in the background."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    await asyncio.gather(*entry._background_tasks)
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def unload_entry(hass, entry) -> None:
+    """Unload a config entry, closing the engine with the last one."""
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,52 @@
+"""Push shipment updates to the webhook of a Parcels App entry, for offline checks.
+
+Run it against a Home Assistant instance, the webhook ID is logged when the
+integration is first set up::
+
+    python -m tests.send_webhook http://localhost:8123/api/webhook/<webhook_id> \
+        ABC123456789 --status delivered
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+
+from .stub_server import make_shipment
+
+
+async def send_update(session, url: str, tracking_ids: list[str], status: str) -> dict:
+    """Push a shipment per tracking ID, returning the response of the webhook."""
+    payload = {
+        "done": True,
+        "shipments": [make_shipment(tracking_id, status) for tracking_id in tracking_ids],
+    }
+    async with session.post(url, json=payload) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def _main(url: str, tracking_ids: list[str], status: str) -> None:
+    """Send the update and print the answer with its latency."""
+    async with aiohttp.ClientSession() as session:
+        start = time.perf_counter()
+        result = await send_update(session, url, tracking_ids, status)
+        latency = time.perf_counter() - start
+    print(f"updated={result['updated']} ignored={result['ignored']} latency_s={latency:.4g}")
+
+
+def main() -> None:
+    """Parse the command line and send the update."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", help="webhook URL of the entry")
+    parser.add_argument("tracking_ids", nargs="+", help="tracking IDs to update")
+    parser.add_argument("--status", default="transit", help="status of the shipments")
+    args = parser.parse_args()
+    asyncio.run(_main(args.url, args.tracking_ids, args.status))
+
+
+if __name__ == "__main__":
+    main()
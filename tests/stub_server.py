@@ -0,0 +1,144 @@
+"""Local aiohttp server imitating the Parcels App tracking API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+import json
+import uuid as uuid_lib
+
+from aiohttp import web
+
+TRACKING_PATH = "/api/v3/shipments/tracking"
+
+
+def make_shipment(tracking_id: str, status: str = "transit", checkpoints: int = 5) -> dict:
+    """Return a shipment in the shape of the tracking results of the API."""
+    start = datetime(2024, 1, 1, 8)
+    states = [
+        {
+            "date": (start + timedelta(hours=12 * index)).isoformat(),
+            "status": f"Checkpoint {index} for {tracking_id}",
+            "location": f"Hub {index}",
+            "carrier": 0,
+        }
+        for index in range(checkpoints)
+    ]
+    # The API lists the newest checkpoint first
+    states.reverse()
+    return {
+        "trackingId": tracking_id,
+        "status": status,
+        "origin": "China",
+        "destination": "France",
+        "states": states,
+        "lastState": states[0] if states else {},
+        "attributes": [
+            {"l": "from", "n": "From", "val": "China"},
+            {"l": "to", "n": "To", "val": "France"},
+            {"l": "days_transit", "n": "Days in transit", "val": str(checkpoints // 2)},
+            {"l": "weight", "n": "Weight", "val": "0.5 kg"},
+        ],
+        "detectedCarrier": {"name": "La Poste", "slug": "la-poste"},
+        "services": [{"slug": "la-poste", "name": "La Poste"}],
+    }
+
+
+class ParcelsAppStub:
+    """Fake Parcels App API counting the requests it receives.
+
+    Tracking requests get a UUID whose results are ``done`` after
+    ``pending_polls`` GET requests. Every response waits ``latency`` seconds,
+    and the status codes queued in ``errors`` are answered before anything else.
+    """
+
+    def __init__(self, pending_polls: int = 0, latency: float = 0.0) -> None:
+        """Initialize the stub."""
+        self.pending_polls = pending_polls
+        self.latency = latency
+        self.errors: list[int] = []
+        # Status of the shipments returned per tracking ID, "transit" by default
+        self.statuses: dict[str, str] = {}
+        self.requests: Counter[str] = Counter()
+        self.tracking_ids_requested: Counter[str] = Counter()
+        self._uuids: dict[str, tuple[list[str], int]] = {}
+        self._runner: web.AppRunner | None = None
+        self.url: str | None = None
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests received."""
+        return sum(self.requests.values())
+
+    def reset_counts(self) -> None:
+        """Forget the requests received so far."""
+        self.requests.clear()
+        self.tracking_ids_requested.clear()
+
+    async def start(self) -> str:
+        """Serve the API on a free local port and return its base URL."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_head("/", self._handle_status)
+        app.router.add_post(TRACKING_PATH, self._handle_track)
+        app.router.add_get(TRACKING_PATH, self._handle_results)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count the request, then apply the latency and queued errors."""
+        self.requests[f"{request.method} {request.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.errors:
+            status = self.errors.pop(0)
+            headers = {"Retry-After": "0"} if status == 429 else None
+            return web.json_response({"error": "stub error"}, status=status, headers=headers)
+        return await handler(request)
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        """Answer the health probe."""
+        return web.Response()
+
+    async def _handle_track(self, request: web.Request) -> web.Response:
+        """Start tracking a batch of shipments and return its UUID."""
+        data = await request.json()
+        tracking_ids = [shipment["trackingId"] for shipment in data["shipments"]]
+        self.tracking_ids_requested.update(tracking_ids)
+        uuid = uuid_lib.uuid4().hex
+        self._uuids[uuid] = (tracking_ids, self.pending_polls)
+        return web.json_response({"uuid": uuid})
+
+    async def _handle_results(self, request: web.Request) -> web.Response:
+        """Return the results of a UUID, once its pending polls are used up."""
+        uuid = request.query["uuid"]
+        if uuid not in self._uuids:
+            return web.json_response({"error": "unknown uuid"}, status=404)
+        tracking_ids, polls_left = self._uuids[uuid]
+        if polls_left > 0:
+            self._uuids[uuid] = (tracking_ids, polls_left - 1)
+            return web.json_response({"done": False, "shipments": []})
+        return web.Response(
+            body=json.dumps(
+                {
+                    "done": True,
+                    "shipments": [
+                        make_shipment(tracking_id, self.statuses.get(tracking_id, "transit"))
+                        for tracking_id in tracking_ids
+                    ],
+                }
+            ),
+            content_type="application/json",
+        )
@@ -0,0 +1,23 @@
+"""Tests of the circuit breaker around the Parcels App API."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.parcelsapp.circuit import STATE_HALF_OPEN, CircuitBreaker
+
+
+def test_throttled_trial_releases_half_open_circuit():
+    """A throttled trial request lets the next request try again."""
+    circuit = CircuitBreaker(1, 60)
+    with patch("custom_components.parcelsapp.circuit.time.monotonic", return_value=0):
+        circuit.record_failure()
+    with patch("custom_components.parcelsapp.circuit.time.monotonic", return_value=60):
+        assert circuit.state == STATE_HALF_OPEN
+        assert circuit.allow_request()
+        assert not circuit.allow_request()
+
+        circuit.record_throttled()
+
+        assert circuit.state == STATE_HALF_OPEN
+        assert circuit.allow_request()
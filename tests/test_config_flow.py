@@ -0,0 +1,55 @@
+"""Tests of the Parcels App options flow."""
+
+from __future__ import annotations
+
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.parcelsapp.const import (
+    CONF_ARCHIVE_AFTER,
+    CONF_BASE_URL,
+    CONF_BATCH_SIZE,
+    CONF_MAX_CONCURRENCY,
+)
+
+from .conftest import add_entry
+
+OPTIONS = {CONF_BATCH_SIZE: 10, CONF_MAX_CONCURRENCY: 2, CONF_ARCHIVE_AFTER: 3}
+
+
+async def test_options_flow(hass, hass_storage):
+    """The options show the current values and are saved."""
+    entry = add_entry(hass, "https://parcelsapp.example", hass_storage)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert CONF_BASE_URL not in result["data_schema"].schema
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=OPTIONS
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    # The base URL, hidden outside of advanced mode, is kept
+    assert entry.options == {**OPTIONS, CONF_BASE_URL: "https://parcelsapp.example"}
+
+
+async def test_options_flow_base_url(hass, hass_storage):
+    """The base URL is only accepted if it is a URL, in advanced mode."""
+    entry = add_entry(hass, "https://parcelsapp.example", hass_storage)
+
+    result = await hass.config_entries.options.async_init(
+        entry.entry_id, context={"show_advanced_options": True}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={**OPTIONS, CONF_BASE_URL: "not a url"}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_BASE_URL: "invalid_url"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={**OPTIONS, CONF_BASE_URL: "http://127.0.0.1:8080"}
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_BASE_URL] == "http://127.0.0.1:8080"
@@ -0,0 +1,69 @@
+"""Tests of the setup of Parcels App config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.parcelsapp.const import DOMAIN
+
+from .conftest import add_entry, setup_entry, stored_packages, unload_entry
+
+
+async def test_unique_ids_are_migrated(hass, hass_storage, parcelsapp_stub, unlimited_rate):
+    """Entities registered before unique IDs were scoped keep their entity IDs."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+    registry = er.async_get(hass)
+    tracking = registry.async_get_or_create(
+        "sensor", DOMAIN, "tracking_PKG00000", config_entry=entry, suggested_object_id="my_parcel"
+    )
+    summary = registry.async_get_or_create(
+        "sensor", DOMAIN, f"{DOMAIN}_summary", config_entry=entry, suggested_object_id="parcels"
+    )
+
+    await setup_entry(hass, entry)
+
+    assert registry.async_get(tracking.entity_id).unique_id == f"{entry.entry_id}_tracking_PKG00000"
+    assert registry.async_get(summary.entity_id).unique_id == f"{entry.entry_id}_summary"
+    assert hass.states.get("sensor.my_parcel").state == "transit"
+
+    await unload_entry(hass, entry)
+
+
+async def test_entries_tracking_the_same_package(
+    hass, hass_storage, parcelsapp_stub, unlimited_rate
+):
+    """Two entries tracking the same package each get their own entities."""
+    first = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+    second = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+
+    # Setting up the integration sets up both entries
+    await setup_entry(hass, first)
+    await asyncio.gather(*second._background_tasks)
+
+    registry = er.async_get(hass)
+    for entry in (first, second):
+        entities = er.async_entries_for_config_entry(registry, entry.entry_id)
+        assert len(entities) == 7
+        assert {entity.unique_id.split("_", 1)[0] for entity in entities} == {entry.entry_id}
+    # Entity IDs still follow the sensor name, suffixed for the second entry
+    assert hass.states.get("sensor.parcel_pkg00000").state == "transit"
+    assert hass.states.get("sensor.parcel_pkg00000_2").state == "transit"
+
+    await unload_entry(hass, first)
+    await unload_entry(hass, second)
+
+
+async def test_unload_shuts_down_once(hass, hass_storage, parcelsapp_stub, unlimited_rate):
+    """Unloading writes the stores once, though the entry also shuts the coordinator down."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+    coordinator = await setup_entry(hass, entry)
+
+    with patch.object(
+        coordinator.quota_store, "async_save", wraps=coordinator.quota_store.async_save
+    ) as save_quota:
+        await unload_entry(hass, entry)
+
+    assert save_quota.call_count == 1
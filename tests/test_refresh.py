@@ -0,0 +1,88 @@
+"""Tests of the refresh cycle of the Parcels App coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.helpers.update_coordinator import REQUEST_REFRESH_DEFAULT_COOLDOWN
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.parcelsapp.const import PENDING_POLL_INITIAL_DELAY
+
+from .conftest import add_entry, setup_entry, stored_packages, unload_entry
+
+TRACKING = "POST /api/v3/shipments/tracking"
+RESULTS = "GET /api/v3/shipments/tracking"
+
+
+async def test_one_refresh_is_one_pass(hass, hass_storage, parcelsapp_stub, unlimited_rate):
+    """A refresh requests each package once and doesn't trigger another refresh."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(30))
+    coordinator = await setup_entry(hass, entry)
+    parcelsapp_stub.reset_counts()
+    parcelsapp_stub.statuses = {"PKG00000": "delivered", "PKG00029": "pickup"}
+    for tracking_id in coordinator.tracked_packages:
+        coordinator.scheduler.schedule(tracking_id, 0)
+
+    await coordinator.async_refresh()
+    # A refresh requested during the cycle would run once the debouncer cools down
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=REQUEST_REFRESH_DEFAULT_COOLDOWN + 1)
+    )
+    await hass.async_block_till_done()
+
+    # Two batches of 20 and 10 packages
+    assert parcelsapp_stub.requests == {TRACKING: 2, RESULTS: 2}
+    assert parcelsapp_stub.tracking_ids_requested == dict.fromkeys(coordinator.tracked_packages, 1)
+    # Changed packages were pushed to their sensors without another cycle
+    for tracking_id, status in parcelsapp_stub.statuses.items():
+        entity_id = coordinator.tracking_entities[tracking_id].entity_id
+        assert hass.states.get(entity_id).state == status
+
+    await unload_entry(hass, entry)
+
+
+async def test_scheduled_refresh_skips_packages_not_due(
+    hass, hass_storage, parcelsapp_stub, unlimited_rate
+):
+    """Only the packages due for a poll are requested by a scheduled refresh."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(30))
+    coordinator = await setup_entry(hass, entry)
+    parcelsapp_stub.reset_counts()
+    coordinator.scheduler.schedule("PKG00003", 0)
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert parcelsapp_stub.requests == {TRACKING: 1, RESULTS: 1}
+    assert parcelsapp_stub.tracking_ids_requested == {"PKG00003": 1}
+
+    await unload_entry(hass, entry)
+
+
+async def test_unload_cancels_running_pending_poll(
+    hass, hass_storage, parcelsapp_stub, unlimited_rate
+):
+    """A pending results poll still waiting for the API is cancelled on unload."""
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(5))
+    coordinator = await setup_entry(hass, entry)
+    parcelsapp_stub.pending_polls = 2
+    await coordinator.update_tracked_packages(force=True)
+    assert coordinator.pending_count == 5
+
+    parcelsapp_stub.reset_counts()
+    parcelsapp_stub.latency = 1
+    with patch.object(coordinator, "_finish_polls") as finish_polls:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=PENDING_POLL_INITIAL_DELAY)
+        )
+        # Let the poll send its request
+        await asyncio.sleep(0.1)
+        assert parcelsapp_stub.requests[RESULTS] == 1
+        await unload_entry(hass, entry)
+        await asyncio.sleep(parcelsapp_stub.latency)
+
+    finish_polls.assert_not_called()
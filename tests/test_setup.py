@@ -0,0 +1,64 @@
+"""Tests of the warm start of the Parcels App integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+from unittest.mock import patch
+
+from custom_components.parcelsapp.const import DOMAIN, WARM_START_SPREAD
+
+from .conftest import add_entry, stored_packages, unload_entry
+
+PARCELS = 1000
+
+
+async def test_setup_does_not_wait_for_the_api(hass, hass_storage, parcelsapp_stub, report):
+    """Sensors are created from the stored packages while the API is still answering."""
+    parcelsapp_stub.latency = 5
+    packages = stored_packages(PARCELS, checked_ago=timedelta(hours=1))
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, packages)
+
+    start = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    setup_time = time.perf_counter() - start
+
+    report(f"setup with {PARCELS} stored parcels", setup_s=setup_time)
+    assert setup_time < parcelsapp_stub.latency
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert len(coordinator.tracking_entities) == PARCELS
+    state = hass.states.get(coordinator.tracking_entities["PKG00000"].entity_id)
+    assert state.state == "transit"
+    assert state.attributes["cached_at"] == packages["PKG00000"]["last_checked"]
+
+    await unload_entry(hass, entry)
+
+
+async def test_warm_start_schedule(hass, hass_storage, parcelsapp_stub):
+    """Overdue packages are spread over the first ticks and stale ones are not polled."""
+    packages = {
+        **stored_packages(10, checked_ago=timedelta(hours=1)),
+        "RECENT": stored_packages(1, checked_ago=timedelta(minutes=1))["PKG00000"],
+        "STALE": stored_packages(1, checked_ago=timedelta(days=32))["PKG00000"],
+    }
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, packages)
+
+    with patch(
+        "custom_components.parcelsapp.coordinator.random.uniform",
+        return_value=WARM_START_SPREAD / 2,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert "STALE" not in coordinator.scheduler
+    now = time.monotonic()
+    assert coordinator.scheduler.pop_due(now) == []
+    assert sorted(coordinator.scheduler.pop_due(now + WARM_START_SPREAD)) == sorted(
+        set(packages) - {"STALE"}
+    )
+    # Every package keeps its sensor, the stale one included
+    assert set(coordinator.tracking_entities) == set(packages)
+
+    await unload_entry(hass, entry)
@@ -0,0 +1,106 @@
+"""Tests of the webhook receiving pushed shipment updates."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import time
+
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.setup import async_setup_component
+
+from custom_components.parcelsapp.const import PUSH_SUBSCRIPTION_TIMEOUT
+from custom_components.parcelsapp.diagnostics import async_get_config_entry_diagnostics
+
+from .conftest import add_entry, setup_entry, stored_packages, unload_entry
+from .send_webhook import send_update
+from .stub_server import make_shipment
+
+
+async def test_pushed_shipment_updates_sensor(
+    hass, hass_storage, hass_client_no_auth, parcelsapp_stub, unlimited_rate
+):
+    """A pushed shipment updates the sensor of its package."""
+    assert await async_setup_component(hass, "webhook", {})
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+    coordinator = await setup_entry(hass, entry)
+    client = await hass_client_no_auth()
+    url = f"/api/webhook/{entry.data[CONF_WEBHOOK_ID]}"
+
+    response = await client.post(
+        url,
+        json={"shipments": [make_shipment("PKG00000", "delivered"), make_shipment("OTHER")]},
+    )
+    await hass.async_block_till_done()
+
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == {"updated": ["PKG00000"], "ignored": ["OTHER"]}
+    entity_id = coordinator.tracking_entities["PKG00000"].entity_id
+    assert hass.states.get(entity_id).state == "delivered"
+
+    await unload_entry(hass, entry)
+
+
+async def test_malformed_shipment_is_rejected(
+    hass, hass_storage, hass_client_no_auth, parcelsapp_stub, unlimited_rate
+):
+    """A shipment whose fields don't have the API types is rejected as a whole."""
+    assert await async_setup_component(hass, "webhook", {})
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+    coordinator = await setup_entry(hass, entry)
+    client = await hass_client_no_auth()
+    url = f"/api/webhook/{entry.data[CONF_WEBHOOK_ID]}"
+
+    for shipment in (
+        {"trackingId": "PKG00000", "status": "delivered", "lastState": "Delivered"},
+        {"trackingId": "PKG00000", "status": "delivered", "states": ["Delivered"]},
+        {"trackingId": "PKG00000", "status": "delivered", "attributes": {"l": "days_transit"}},
+        {"trackingId": "PKG00000", "status": "delivered", "detectedCarrier": "La Poste"},
+    ):
+        response = await client.post(url, json={"shipments": [shipment]})
+        assert response.status == HTTPStatus.BAD_REQUEST
+    await hass.async_block_till_done()
+
+    entity_id = coordinator.tracking_entities["PKG00000"].entity_id
+    assert hass.states.get(entity_id).state == "transit"
+
+    await unload_entry(hass, entry)
+
+
+async def test_diagnostics_redact_webhook_id(hass, hass_storage, parcelsapp_stub, unlimited_rate):
+    """The webhook ID, which is enough to push updates, is not shared in diagnostics."""
+    assert await async_setup_component(hass, "webhook", {})
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(1))
+    await setup_entry(hass, entry)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][CONF_WEBHOOK_ID] == "**REDACTED**"
+
+    await unload_entry(hass, entry)
+
+
+async def test_local_sender(
+    hass, hass_storage, hass_client_no_auth, parcelsapp_stub, unlimited_rate
+):
+    """The local test sender pushes updates the webhook accepts, without polling."""
+    assert await async_setup_component(hass, "webhook", {})
+    entry = add_entry(hass, parcelsapp_stub.url, hass_storage, stored_packages(3))
+    coordinator = await setup_entry(hass, entry)
+    client = await hass_client_no_auth()
+    parcelsapp_stub.reset_counts()
+
+    result = await send_update(
+        client, f"/api/webhook/{entry.data[CONF_WEBHOOK_ID]}", ["PKG00001", "PKG00002"], "pickup"
+    )
+    await hass.async_block_till_done()
+
+    assert result == {"updated": ["PKG00001", "PKG00002"], "ignored": []}
+    for tracking_id in result["updated"]:
+        entity_id = coordinator.tracking_entities[tracking_id].entity_id
+        assert hass.states.get(entity_id).state == "pickup"
+    # Pushed packages are not polled while updates keep being pushed
+    due = coordinator.scheduler.pop_due(time.monotonic() + PUSH_SUBSCRIPTION_TIMEOUT - 1)
+    assert not set(due) & set(result["updated"])
+    assert parcelsapp_stub.total_requests == 0
+
+    await unload_entry(hass, entry)